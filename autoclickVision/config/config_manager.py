@@ -14,7 +14,7 @@ import logging
 import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -78,6 +78,9 @@ def _migrate(data: dict) -> dict:
 class ConfigManager:
     """Read, validate, save, and manage task configuration files."""
 
+    # (presets dir mtime_ns, sorted preset names) — see ``list_presets``
+    _presets_cache: Optional[Tuple[int, List[str]]] = None
+
     def __init__(self, auto_save: bool = True, encryption_password: Optional[str] = None):
         """
         Args:
@@ -185,25 +188,40 @@ class ConfigManager:
     def save_preset(self, preset_name: str) -> Path:
         """Save current config as a preset template."""
         p = PRESETS_DIR / f"{preset_name}.json"
-        return self.save(p)
+        saved = self.save(p)
+        ConfigManager._presets_cache = None
+        return saved
 
     def load_preset(self, preset_name: str) -> TaskConfig:
         """Load a named preset."""
         p = PRESETS_DIR / f"{preset_name}.json"
         return self.load(p)
 
-    @staticmethod
-    def list_presets() -> List[str]:
-        """Return names of all available presets."""
-        return sorted(
-            p.stem
-            for p in PRESETS_DIR.glob("*.json")
-        )
+    @classmethod
+    def list_presets(cls) -> List[str]:
+        """Return names of all available presets.
+
+        The listing is cached and only re-scanned when the presets
+        directory's mtime changes (or a preset is saved / deleted here).
+        """
+        mtime = PRESETS_DIR.stat().st_mtime_ns
+        cached = cls._presets_cache
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+        with os.scandir(PRESETS_DIR) as it:
+            names = sorted(
+                e.name[:-5]
+                for e in it
+                if e.name.endswith(".json") and e.is_file()
+            )
+        cls._presets_cache = (mtime, names)
+        return list(names)
 
     def delete_preset(self, preset_name: str) -> None:
         p = PRESETS_DIR / f"{preset_name}.json"
         if p.exists():
             p.unlink()
+            ConfigManager._presets_cache = None
             logger.info("Preset deleted: %s", preset_name)
 
     # ─── Validation ─────────────────────────────────────────────
@@ -75,6 +75,9 @@ class ImageMatcher:
         self.multi_scale = multi_scale
         self.scale_range = scale_range or self.DEFAULT_SCALE_RANGE
         self.scale_step = scale_step or self.DEFAULT_SCALE_STEP
+        # (source, preprocessed) for the most recent screenshot, so matching
+        # several templates against one frame converts it only once.
+        self._scene_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
     # ─── Template loading ───────────────────────────────────────
 
@@ -95,6 +98,22 @@ class ImageMatcher:
             return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         return image
 
+    def _preprocess_scene(self, screenshot: np.ndarray) -> np.ndarray:
+        """Like ``_preprocess`` but reuses the result for the same screenshot object.
+
+        The cache holds a reference to *screenshot*, so an identity check is
+        enough to tell frames apart.  Callers must not modify a screenshot
+        in place between matches.
+        """
+        if not (self.grayscale and len(screenshot.shape) == 3):
+            return screenshot
+        cached = self._scene_cache  # single read: safe with parallel matching
+        if cached is not None and cached[0] is screenshot:
+            return cached[1]
+        processed = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+        self._scene_cache = (screenshot, processed)
+        return processed
+
     # ─── Single-scale template match ────────────────────────────
 
     def _match_single_scale(
@@ -104,7 +123,7 @@ class ImageMatcher:
         confidence: float,
     ) -> MatchResult:
         """Run cv2.matchTemplate at the original scale."""
-        ss = self._preprocess(screenshot)
+        ss = self._preprocess_scene(screenshot)
         tpl = self._preprocess(template)
 
         if ss.shape[0] < tpl.shape[0] or ss.shape[1] < tpl.shape[1]:
@@ -135,7 +154,7 @@ class ImageMatcher:
         confidence: float,
     ) -> MatchResult:
         """Resize the template across a range of scales and keep the best match."""
-        ss = self._preprocess(screenshot)
+        ss = self._preprocess_scene(screenshot)
         tpl_orig = self._preprocess(template)
         th_orig, tw_orig = tpl_orig.shape[:2]
 
@@ -17,11 +17,12 @@ from __future__ import annotations
 import logging
 import random
 import re
+import sys
 import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -35,6 +36,45 @@ from .matcher import FailureAction, ImageMatcher, MatchResult
 
 logger = logging.getLogger(__name__)
 
+# Windows' default timer tick is ~15.6 ms; while a task runs, ask for 1 ms
+# so short sleeps between clicks land close to their target.  Held only for
+# the run (see SequenceScheduler._run): the setting is process-wide (system-
+# wide on older Windows) and costs power while idle.
+_winmm = None
+if sys.platform == "win32":
+    try:
+        import ctypes
+
+        _winmm = ctypes.windll.winmm
+    except (AttributeError, OSError):
+        pass
+
+
+def _begin_timer_period() -> None:
+    if _winmm is not None:
+        _winmm.timeBeginPeriod(1)
+
+
+def _end_timer_period() -> None:
+    if _winmm is not None:
+        _winmm.timeEndPeriod(1)
+
+# The final stretch of a delay is spun on perf_counter instead of slept,
+# since the OS scheduler may wake us up to one quantum late.
+_SPIN_THRESHOLD = 0.002
+
+
+def _precise_sleep(seconds: float) -> None:
+    """Sleep for *seconds*, busy-waiting the last ``_SPIN_THRESHOLD`` for accuracy."""
+    if seconds <= 0:
+        return
+    deadline = time.perf_counter() + seconds
+    coarse = seconds - _SPIN_THRESHOLD
+    if coarse > 0:
+        time.sleep(coarse)
+    while time.perf_counter() < deadline:
+        pass
+
 
 # ──────────────────────────────────────────────────────────────────
 # Enums & small helpers
@@ -67,6 +107,42 @@ class TaskState(str, Enum):
 # Data classes
 # ──────────────────────────────────────────────────────────────────
 
+_FIELD_DEFAULTS: Dict[type, Dict[str, Any]] = {}
+
+
+def _field_defaults(cls: type) -> Dict[str, Any]:
+    """Default value of each field of dataclass *cls*, computed once per class.
+
+    Fields marked ``metadata={"unique": True}`` (factories that mint a new
+    value per instance, like ids) never equal a default and are left out.
+    The cached factory results are only compared against, never handed out.
+    """
+    defaults = _FIELD_DEFAULTS.get(cls)
+    if defaults is None:
+        defaults = {}
+        for f in fields(cls):
+            if f.metadata.get("unique"):
+                continue
+            if f.default is not MISSING:
+                defaults[f.name] = f.default
+            elif f.default_factory is not MISSING:
+                defaults[f.name] = f.default_factory()
+        _FIELD_DEFAULTS[cls] = defaults
+    return defaults
+
+
+def _drop_defaults(obj: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove entries of *data* whose field on *obj* still has its default.
+
+    ``from_dict`` fills missing keys from the dataclass defaults, so the
+    serialised form only needs the values that differ.
+    """
+    for name, default in _field_defaults(type(obj)).items():
+        if name in data and getattr(obj, name) == default:
+            del data[name]
+    return data
+
+
 @dataclass
 class DelayConfig:
     """Configurable delay: fixed value, random range, or default random."""
@@ -85,15 +161,21 @@ class DelayConfig:
         else:
             return random.uniform(self.default_min, self.default_max)
 
+    def sleep(self) -> float:
+        """Sleep for one sampled delay and return the duration used."""
+        d = self.get()
+        _precise_sleep(d)
+        return d
+
     def to_dict(self) -> dict:
-        return {
+        return _drop_defaults(self, {
             "mode": self.mode,
             "fixed_value": self.fixed_value,
             "range_min": self.range_min,
             "range_max": self.range_max,
             "default_min": self.default_min,
             "default_max": self.default_max,
-        }
+        })
 
     @classmethod
     def from_dict(cls, d: dict) -> "DelayConfig":
@@ -103,7 +185,7 @@ class DelayConfig:
 @dataclass
 class ButtonConfig:
     """Configuration for a single recognisable button."""
-    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8], metadata={"unique": True})
     name: str = ""
     image_path: str = ""
     confidence: float = 0.8
@@ -129,7 +211,7 @@ class ButtonConfig:
             "fallback_action": self.fallback_action.value,
             "long_press_duration": self.long_press_duration,
         }
-        return d
+        return _drop_defaults(self, d)
 
     @classmethod
     def from_dict(cls, d: dict) -> "ButtonConfig":
@@ -154,18 +236,20 @@ class StepConfig:
     condition_timeout: float = 30.0  # seconds to wait for the condition before fallback
 
     def to_dict(self) -> dict:
-        return {
-            "button_ids": self.button_ids,
+        return _drop_defaults(self, {
+            "button_ids": list(self.button_ids),
             "repeat": self.repeat,
             "intra_delay": self.intra_delay.to_dict(),
             "inter_delay": self.inter_delay.to_dict(),
             "condition": self.condition.value,
             "condition_timeout": self.condition_timeout,
-        }
+        })
 
     @classmethod
     def from_dict(cls, d: dict) -> "StepConfig":
         kw = dict(d)
+        if "button_ids" in kw:
+            kw["button_ids"] = list(kw["button_ids"])
         if "intra_delay" in kw:
             kw["intra_delay"] = DelayConfig.from_dict(kw["intra_delay"])
         if "inter_delay" in kw:
@@ -196,7 +280,7 @@ class TaskConfig:
         return None
 
     def to_dict(self) -> dict:
-        return {
+        return _drop_defaults(self, {
             "name": self.name,
             "buttons": [b.to_dict() for b in self.buttons],
             "steps": [s.to_dict() for s in self.steps],
@@ -207,7 +291,7 @@ class TaskConfig:
             "chain_task_path": self.chain_task_path,
             "stop_after_consecutive_failures": self.stop_after_consecutive_failures,
             "stop_after_duration_minutes": self.stop_after_duration_minutes,
-        }
+        })
 
     @classmethod
     def from_dict(cls, d: dict) -> "TaskConfig":
@@ -226,6 +310,8 @@ class TaskConfig:
 # ──────────────────────────────────────────────────────────────────
 
 _STEP_RE = re.compile(r"([A-Za-z0-9_]+)(?:\*(\d+))?")
+_STEP_SEP_RE = re.compile(r"\s*->\s*")   # between steps
+_ALT_SEP_RE = re.compile(r"\s*\|\s*")   # between mutually-exclusive buttons
 
 
 def parse_sequence_text(text: str, button_map: Dict[str, str]) -> List[StepConfig]:
@@ -240,19 +326,25 @@ def parse_sequence_text(text: str, button_map: Dict[str, str]) -> List[StepConfi
         List of ``StepConfig``.
     """
     steps: List[StepConfig] = []
-    parts = [p.strip() for p in text.split("->")]
-    for part in parts:
+    # Long pastes repeat a handful of tokens, so each distinct token is
+    # matched once: token → (button id or None, repeat), or None if malformed
+    tokens: Dict[str, Optional[Tuple[Optional[str], int]]] = {}
+    for part in _STEP_SEP_RE.split(text.strip()):
         # Support mutual-exclusion: "A|B" means whichever is found first
-        alternatives = [alt.strip() for alt in part.split("|")]
         button_ids: List[str] = []
         repeat = 1
-        for alt in alternatives:
-            m = _STEP_RE.fullmatch(alt)
-            if m:
-                name = m.group(1)
-                r = int(m.group(2)) if m.group(2) else 1
+        for alt in _ALT_SEP_RE.split(part):
+            try:
+                tok = tokens[alt]
+            except KeyError:
+                m = _STEP_RE.fullmatch(alt)
+                tok = tokens[alt] = (
+                    (button_map.get(m.group(1)), int(m.group(2)) if m.group(2) else 1)
+                    if m else None
+                )
+            if tok is not None:
+                bid, r = tok
                 repeat = max(repeat, r)
-                bid = button_map.get(name)
                 if bid:
                     button_ids.append(bid)
         if button_ids:
@@ -299,6 +391,7 @@ class SequenceScheduler:
         on_failure_screenshot: Optional[Callable[[np.ndarray, str], None]] = None,
         on_chain_task: Optional[Callable[[str], None]] = None,
         on_recognition_result: Optional[Callable[[bool], None]] = None,
+        on_round_summary: Optional[Callable[[int, int, int, int], None]] = None,
     ):
         self.capture = capture
         self.matcher = matcher
@@ -309,6 +402,8 @@ class SequenceScheduler:
         self._on_failure_screenshot = on_failure_screenshot or (lambda img, msg: None)
         self._on_chain_task = on_chain_task or (lambda path: None)
         self._on_recognition_result = on_recognition_result or (lambda success: None)
+        # (round, success, failure, skipped), once per finished round
+        self._on_round_summary = on_round_summary or (lambda rnd, ok, fail, skip: None)
 
         self._state = TaskState.IDLE
         self._thread: Optional[threading.Thread] = None
@@ -532,12 +627,10 @@ class SequenceScheduler:
 
             # Intra-button delay between repeats
             if rep < step.repeat - 1:
-                d = step.intra_delay.get()
-                time.sleep(d)
+                step.intra_delay.sleep()
 
         # Inter-button delay after this step
-        d = step.inter_delay.get()
-        time.sleep(d)
+        step.inter_delay.sleep()
 
     def _perform_click(self, button: ButtonConfig, x: int, y: int) -> None:
         ct = button.click_type
@@ -629,6 +722,7 @@ class SequenceScheduler:
 
         loop_count = task.loop_count if task.loop_count > 0 else float("inf")
         rnd = 0
+        _begin_timer_period()
         try:
             while rnd < loop_count:
                 if self._stop_event.is_set():
@@ -675,6 +769,7 @@ class SequenceScheduler:
                 self._log(
                     f"── Round {rnd} done: ✔{rs.success} ✖{rs.failure} ⏭{rs.skipped} ──"
                 )
+                self._on_round_summary(rnd, rs.success, rs.failure, rs.skipped)
 
                 # Interval between rounds
                 if rnd < loop_count and not self._stop_event.is_set():
@@ -693,6 +788,8 @@ class SequenceScheduler:
             self._set_state(TaskState.ERROR)
             self._log(f"✖ Error: {exc}")
             logger.exception("Scheduler error")
+        finally:
+            _end_timer_period()
 
         # Chain to next task if configured
         if (
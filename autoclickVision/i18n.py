@@ -79,12 +79,12 @@ _ZH: Dict[str, str] = {
 
     # ── Main Window — toolbar ────────────────────────────────
     "Main Toolbar": "主工具栏",
-    "▶ Start": "▶ 开始",
-    "⏸ Pause": "⏸ 暂停",
-    "⏹ Stop": "⏹ 停止",
-    "📂 Open": "📂 打开",
-    "💾 Save": "💾 保存",
-    "📄 Save As…": "📄 另存为…",
+    "Start": "开始",
+    "Pause": "暂停",
+    "Stop": "停止",
+    "Open": "打开",
+    "Save": "保存",
+    "Save As…": "另存为…",
     "Settings": "设置",
 
     # ── Main Window — tabs ───────────────────────────────────
@@ -141,6 +141,8 @@ _ZH: Dict[str, str] = {
     "Match Found": "匹配成功",
     "Not Found": "未找到",
     "Select Button Image": "选择按钮图片",
+    "Capture Failed": "截图失败",
+    "Could not capture the screen.": "无法截取屏幕。",
 
     # ── Sequence Editor ──────────────────────────────────────
     "Visual Mode": "可视模式",
@@ -180,6 +182,7 @@ _ZH: Dict[str, str] = {
     "No log files found.": "未找到日志文件。",
     "Historical Runs": "历史运行记录",
     "Load into viewer": "加载到查看器",
+    "Preview shows only the last {0} KB of {1} KB.": "预览仅显示 {1} KB 中的最后 {0} KB。",
 
     # ── Settings Dialog ──────────────────────────────────────
     "Grayscale matching": "灰度匹配",
@@ -189,6 +192,7 @@ _ZH: Dict[str, str] = {
     "Scale step:": "缩放步长:",
     "Bézier curve mouse movement": "贝塞尔曲线鼠标移动",
     "PyDirectInput mode (fullscreen games)": "PyDirectInput 模式（全屏游戏）",
+    "Global hotkeys (F9/F10/F11 work while unfocused)": "全局热键（F9/F10/F11 在窗口未聚焦时也有效）",
     "Matcher": "匹配器",
     "Click": "点击",
     "Notifications": "通知",
@@ -73,12 +73,14 @@ def _choose_language_dialog():
 
 def main():
     from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtGui import QIcon, QPixmap
+    from PyQt6.QtGui import QIcon, QPixmap, QPixmapCache
     from autoclickVision.i18n import init_language, save_preference, set_language, _load_preference
+    from autoclickVision.ui.thumbnails import PIXMAP_CACHE_LIMIT_KB
 
     app = QApplication(sys.argv)
     app.setApplicationName("AutoClick Vision")
     app.setOrganizationName("AutoClickVision")
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
 
     # Set application-level icon (loaded via QPixmap for reliability)
     icon_path = Path(__file__).resolve().parent / "assets" / "icon.ico"
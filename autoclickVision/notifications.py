@@ -14,8 +14,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
-import requests
-
 logger = logging.getLogger(__name__)
 
 _LOGS_DIR = Path(__file__).resolve().parent / "logs"
@@ -127,7 +125,8 @@ class WebhookNotifier:
         Returns a dict ``{name: success}`` indicating delivery status.
         """
         results: Dict[str, bool] = {}
-        for name, url in self._hooks.items():
+        # Snapshot: notify may run on a worker while the hooks are re-synced
+        for name, url in list(self._hooks.items()):
             try:
                 ok = self._send(url, message)
                 results[name] = ok
@@ -152,6 +151,8 @@ class WebhookNotifier:
             # Generic JSON POST
             payload = {"text": message, "content": message}
 
+        import requests  # deferred: ~70 ms of startup, only needed once a webhook fires
+
         resp = requests.post(url, json=payload, timeout=self._timeout)
         ok = resp.status_code in (200, 201, 204)
         if not ok:
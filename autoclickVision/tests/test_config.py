@@ -13,7 +13,7 @@ from pathlib import Path
 
 import yaml
 
-from autoclickVision.config.config_manager import ConfigManager, CONFIG_VERSION
+from autoclickVision.config.config_manager import ConfigManager, CONFIG_VERSION, PRESETS_DIR
 from autoclickVision.core.scheduler import (
     ButtonConfig,
     ClickType,
@@ -132,6 +132,17 @@ class TestPresets(unittest.TestCase):
         names2 = ConfigManager.list_presets()
         self.assertNotIn("test_preset_unit", names2)
 
+    def test_list_presets_sees_external_files(self):
+        """Presets dropped into the folder by hand show up despite the cache."""
+        ConfigManager.list_presets()  # prime the cache
+        p = PRESETS_DIR / "test_preset_external.json"
+        p.write_text(json.dumps({"name": "External"}), encoding="utf-8")
+        try:
+            self.assertIn("test_preset_external", ConfigManager.list_presets())
+        finally:
+            p.unlink()
+        self.assertNotIn("test_preset_external", ConfigManager.list_presets())
+
 
 class TestDelayConfig(unittest.TestCase):
     """Test DelayConfig modes."""
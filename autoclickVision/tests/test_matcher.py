@@ -64,6 +64,15 @@ class TestSingleScaleMatch(unittest.TestCase):
         result = matcher.match(scene, tpl)
         self.assertTrue(result.found)
 
+    def test_grayscale_new_frame_not_stale(self):
+        """The per-frame grayscale cache must not leak into the next frame."""
+        scene, tpl, _ = self._make_scene_and_template()
+        matcher = ImageMatcher(default_confidence=0.9, grayscale=True)
+        self.assertTrue(matcher.match(scene, tpl).found)
+        self.assertTrue(matcher.match(scene, tpl).found)  # cached frame
+        blank = np.full_like(scene, 200)
+        self.assertFalse(matcher.match(blank, tpl).found)
+
     def test_region_restricted(self):
         scene, tpl, _ = self._make_scene_and_template()
         matcher = ImageMatcher(default_confidence=0.9)
@@ -44,10 +44,23 @@ class TestParseSequenceText(unittest.TestCase):
         self.assertIn("id_a", steps[0].button_ids)
         self.assertIn("id_b", steps[0].button_ids)
 
+    def test_irregular_whitespace(self):
+        steps = parse_sequence_text("  A*2->B |  C   ->  D ", self._make_map())
+        self.assertEqual(len(steps), 3)
+        self.assertEqual(steps[0].repeat, 2)
+        self.assertEqual(steps[1].button_ids, ["id_b", "id_c"])
+        self.assertEqual(steps[2].button_ids, ["id_d"])
+
     def test_unknown_button(self):
         steps = parse_sequence_text("X -> Y", self._make_map())
         self.assertEqual(len(steps), 0)  # no valid buttons
 
+    def test_repeated_tokens(self):
+        steps = parse_sequence_text("A*2 -> A -> A B -> X*4|A -> A*2", self._make_map())
+        self.assertEqual([(s.button_ids, s.repeat) for s in steps], [
+            (["id_a"], 2), (["id_a"], 1), (["id_a"], 4), (["id_a"], 2),
+        ])
+
 
 class TestDataClassRoundTrip(unittest.TestCase):
     """Ensure to_dict / from_dict identity."""
@@ -79,6 +92,14 @@ class TestDataClassRoundTrip(unittest.TestCase):
         self.assertEqual(s2.repeat, 5)
         self.assertEqual(s2.condition, StepCondition.WAIT_APPEAR)
 
+    def test_step_config_does_not_alias_lists(self):
+        s = StepConfig(button_ids=["a"])
+        d = s.to_dict()
+        s2 = StepConfig.from_dict(d)
+        d["button_ids"].append("b")
+        self.assertEqual(s.button_ids, ["a"])
+        self.assertEqual(s2.button_ids, ["a"])
+
     def test_task_config(self):
         t = TaskConfig(
             name="Test",
@@ -92,6 +113,27 @@ class TestDataClassRoundTrip(unittest.TestCase):
         self.assertEqual(len(t2.buttons), 1)
         self.assertEqual(t2.scheduled_start, "2026-03-01T10:00:00")
 
+    def test_to_dict_omits_defaults(self):
+        t = TaskConfig(name="Test", steps=[StepConfig(button_ids=["x"], repeat=2)])
+        d = t.to_dict()
+        self.assertNotIn("loop_count", d)
+        self.assertNotIn("buttons", d)
+        self.assertEqual(d["steps"], [{"button_ids": ["x"], "repeat": 2}])
+        t2 = TaskConfig.from_dict(d)
+        self.assertEqual(t2.loop_count, TaskConfig().loop_count)
+        self.assertEqual(t2.round_interval_delay, TaskConfig().round_interval_delay)
+        self.assertEqual(t2.steps[0].intra_delay, DelayConfig())
+
+    def test_button_id_always_serialised(self):
+        b = ButtonConfig(name="ok")
+        self.assertEqual(b.to_dict(), {"id": b.id, "name": "ok"})
+        self.assertEqual(ButtonConfig.from_dict(b.to_dict()).id, b.id)
+
+    def test_non_default_delay_survives(self):
+        d = DelayConfig(mode="range", range_min=2.0)
+        self.assertEqual(d.to_dict(), {"mode": "range", "range_min": 2.0})
+        self.assertEqual(DelayConfig.from_dict(d.to_dict()), d)
+
 
 class TestDelayPrecision(unittest.TestCase):
     """Verify that delay values are within expected range."""
@@ -99,9 +141,10 @@ class TestDelayPrecision(unittest.TestCase):
     def test_fixed_delay(self):
         d = DelayConfig(mode="fixed", fixed_value=0.25)
         t0 = time.perf_counter()
-        time.sleep(d.get())
+        d.sleep()
         elapsed = time.perf_counter() - t0
         self.assertAlmostEqual(elapsed, 0.25, delta=0.1)
+        self.assertGreaterEqual(elapsed, 0.25)
 
     def test_range_delay_bounds(self):
         d = DelayConfig(mode="range", range_min=0.1, range_max=0.3)
@@ -0,0 +1,53 @@
+"""
+Unit Tests — Sequence Editor
+Tests loop/schedule settings round-trips through the editor widgets.
+"""
+
+from __future__ import annotations
+
+import os
+import unittest
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from autoclickVision.config.config_manager import ConfigManager  # noqa: E402
+from autoclickVision.core.scheduler import TaskConfig  # noqa: E402
+from autoclickVision.ui.sequence_editor import SequenceEditor  # noqa: E402
+
+_app = QApplication.instance() or QApplication([])
+
+
+class TestScheduledStart(unittest.TestCase):
+    """scheduled_start must come back as a naive local ISO string."""
+
+    def setUp(self):
+        self.editor = SequenceEditor(ConfigManager())
+
+    def _round_trip(self, value):
+        self.editor.load_from_task(TaskConfig(scheduled_start=value))
+        return self.editor.get_loop_settings()["scheduled_start"]
+
+    def test_naive_unchanged(self):
+        self.assertEqual(self._round_trip("2026-10-16T10:00:00"), "2026-10-16T10:00:00")
+
+    def test_offset_comes_back_naive(self):
+        for value in ("2026-10-16T10:00:00+02:00", "2026-10-16T08:00:00Z"):
+            out = self._round_trip(value)
+            parsed = datetime.fromisoformat(out)
+            self.assertIsNone(parsed.tzinfo, out)
+            # Same instant, expressed in local time
+            expected = datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone().replace(tzinfo=None)
+            self.assertEqual(parsed, expected)
+            self.assertIsInstance(parsed > datetime.now(), bool)
+
+    def test_no_schedule_clears_cache(self):
+        self._round_trip("2026-10-16T10:00:00")
+        self.editor.load_from_task(TaskConfig())
+        self.assertIsNone(self.editor._scheduled_src)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,15 +7,17 @@ capture tool.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import time
 import uuid
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
-from PyQt6.QtCore import Qt, QMimeData, QPointF, QRectF, pyqtSignal
+from PyQt6.QtCore import Qt, QMimeData, QPointF, QRectF, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QImage, QPixmap
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -44,10 +46,47 @@ from ..core.capture import ScreenCapture
 from ..core.matcher import FailureAction, ImageMatcher, MatchResult
 from ..core.scheduler import ButtonConfig, ClickType, TaskConfig
 from ..i18n import tr
+from .thumbnails import cached_scaled_pixmap, scale_transform
 
 logger = logging.getLogger(__name__)
 
 
+# ──────────────────────────────────────────────────────────────────
+# Helpers
+# ──────────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=64)
+def _load_template_cached(path: str, mtime: float) -> np.ndarray:
+    """``ImageMatcher.load_template`` memoised per file version (*mtime*)."""
+    return ImageMatcher.load_template(path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_stem(path: str) -> str:
+    return Path(path).stem
+
+
+def _bgr_to_qimage(image: np.ndarray) -> QImage:
+    """
+    Convert a BGR frame to a display-ready ``QImage`` that owns its pixels.
+
+    Qt reads BGR888 natively (no cvtColor copy); the single conversion to
+    RGB32 here is the only one, so ``QPixmap.fromImage`` can then take the
+    result without converting again.  Safe to call off the GUI thread.
+    """
+    image = np.ascontiguousarray(image)
+    h, w, ch = image.shape
+    # PyQt6 wraps the buffer-protocol memoryview without copying (the QImage
+    # points straight at the ndarray), so no sip.voidptr juggling is needed.
+    qimg = QImage(image.data, w, h, ch * w, QImage.Format.Format_BGR888)
+    return qimg.convertToFormat(QImage.Format.Format_RGB32)
+
+
+def _bgr_to_pixmap(image: np.ndarray) -> QPixmap:
+    """Convert a BGR frame to a ``QPixmap`` (GUI thread only)."""
+    return QPixmap.fromImage(_bgr_to_qimage(image), Qt.ImageConversionFlag.NoFormatConversion)
+
+
 # ──────────────────────────────────────────────────────────────────
 # Region capture overlay
 # ──────────────────────────────────────────────────────────────────
@@ -70,7 +109,7 @@ class RegionCaptureOverlay(QWidget):
     _MAX_ZOOM = 10.0
     _ZOOM_FACTOR = 1.15  # per wheel step
 
-    def __init__(self, screenshot: np.ndarray, parent=None):
+    def __init__(self, screenshot: np.ndarray, parent=None, pixmap: Optional[QPixmap] = None):
         super().__init__(parent)
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint
@@ -79,11 +118,8 @@ class RegionCaptureOverlay(QWidget):
         self.setCursor(Qt.CursorShape.CrossCursor)
         self.setMouseTracking(True)
 
-        # Convert BGR screenshot → QPixmap
-        h, w, ch = screenshot.shape
-        rgb = cv2.cvtColor(screenshot, cv2.COLOR_BGR2RGB)
-        qimg = QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
-        self._bg_pixmap = QPixmap.fromImage(qimg)
+        # *pixmap*, when given, is the already-converted *screenshot*
+        self._bg_pixmap = pixmap if pixmap is not None else _bgr_to_pixmap(screenshot)
 
         # Viewport transform: image is drawn at  (pos * _zoom + _offset)
         self._zoom: float = 1.0
@@ -237,10 +273,51 @@ class RegionCaptureOverlay(QWidget):
 # Button Editor Panel
 # ──────────────────────────────────────────────────────────────────
 
+class _ImageWriteTask(QRunnable):
+    """Write a BGR image to disk on the thread pool, then emit *done(path)*."""
+
+    def __init__(self, path: str, image: np.ndarray, done):
+        super().__init__()
+        self._path = path
+        self._image = image
+        self._done = done
+
+    def run(self):
+        if not cv2.imwrite(self._path, self._image):
+            logger.error("Failed to write captured image: %s", self._path)
+        self._done.emit(self._path)
+
+
+class _CaptureTask(QRunnable):
+    """
+    Grab the full screen on the thread pool and convert it to a
+    display-ready ``QImage``, then emit *done(frame, image)*.
+    """
+
+    def __init__(self, capture: ScreenCapture, done):
+        super().__init__()
+        self._capture = capture
+        self._done = done
+
+    def run(self):
+        try:
+            frame = self._capture.capture_full()
+            # Leaves only a cheap fromImage() for the GUI thread
+            image = _bgr_to_qimage(frame)
+        except Exception:
+            logger.exception("Screen capture failed")
+            self._done.emit(None, None)
+            return
+        self._done.emit(frame, image)
+
+
 class ButtonEditor(QWidget):
     """Panel for managing button configurations."""
 
     buttons_changed = pyqtSignal()
+    # Emitted from pool threads
+    _image_saved = pyqtSignal(str)
+    _capture_ready = pyqtSignal(object, object)  # frame, QImage (None, None on error)
 
     def __init__(
         self,
@@ -255,6 +332,13 @@ class ButtonEditor(QWidget):
         self._matcher = matcher
         self._buttons: List[ButtonConfig] = []
         self._current_idx: int = -1
+        # (monotonic time, BGR frame, pixmap) of the latest overlay capture
+        self._last_capture: Optional[Tuple[float, np.ndarray, QPixmap]] = None
+        self._capture_callbacks: list = []
+        # Captured crops still being written to disk, keyed by target path
+        self._pending_images: Dict[str, np.ndarray] = {}
+        self._image_saved.connect(self._on_image_saved)
+        self._capture_ready.connect(self._on_capture_ready)
         self._build_ui()
         self.setAcceptDrops(True)
 
@@ -383,20 +467,27 @@ class ButtonEditor(QWidget):
             event.acceptProposedAction()
 
     def dropEvent(self, event: QDropEvent):
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")):
-                self._add_button_from_image(path)
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        self._add_buttons_from_images(
+            [p for p in paths if p.lower().endswith((".png", ".jpg", ".jpeg", ".bmp"))])
 
     # ═════════════════════════════════════════════════════════════
     # List management
     # ═════════════════════════════════════════════════════════════
 
+    @staticmethod
+    def _label_for(b: ButtonConfig) -> str:
+        if b.name:
+            return b.name
+        return _path_stem(b.image_path) if b.image_path else b.id
+
     def _refresh_list(self):
-        self._list.clear()
-        for b in self._buttons:
-            label = b.name or Path(b.image_path).stem if b.image_path else b.id
-            self._list.addItem(label)
+        self._list.setUpdatesEnabled(False)
+        try:
+            self._list.clear()
+            self._list.addItems([self._label_for(b) for b in self._buttons])
+        finally:
+            self._list.setUpdatesEnabled(True)
         self.buttons_changed.emit()
 
     def _on_select(self, idx: int):
@@ -420,13 +511,28 @@ class ButtonEditor(QWidget):
         paths, _ = QFileDialog.getOpenFileNames(
             self, tr("Import Button Images"), "", tr("Images (*.png *.jpg *.jpeg *.bmp)")
         )
-        for p in paths:
-            self._add_button_from_image(p)
+        self._add_buttons_from_images(paths)
 
-    def _add_button_from_image(self, path: str):
+    def _add_buttons_from_images(self, paths: List[str]):
+        """Add one button per image path, rebuilding the list once at the end."""
+        if not paths:
+            return
+        for path in paths:
+            self._buttons.append(ButtonConfig(name=Path(path).stem, image_path=path))
+        self._refresh_list()
+        self._list.setCurrentRow(len(self._buttons) - 1)
+
+    def _add_button_from_image(self, path: str, image: Optional[np.ndarray] = None):
+        """
+        Add a button for *path*.  When the BGR *image* is already in memory
+        (fresh screen capture) it is used for the preview directly, so the
+        file doesn't have to be on disk yet.
+        """
         name = Path(path).stem
         bc = ButtonConfig(name=name, image_path=path)
         self._buttons.append(bc)
+        if image is not None:
+            self._pending_images[path] = image
         self._refresh_list()
         self._list.setCurrentRow(len(self._buttons) - 1)
 
@@ -502,7 +608,7 @@ class ButtonEditor(QWidget):
         # Refresh the list label
         item = self._list.currentItem()
         if item is not None:
-            item.setText(b.name or b.id)
+            item.setText(self._label_for(b))
         self.buttons_changed.emit()
 
     def _on_browse_image(self):
@@ -516,12 +622,20 @@ class ButtonEditor(QWidget):
             self._update_thumbnail(path)
 
     def _update_thumbnail(self, path: str):
-        if path and os.path.isfile(path):
-            pm = QPixmap(path).scaled(
-                self._lbl_thumb.size(),
+        dpr = self._lbl_thumb.devicePixelRatioF()
+        target = self._lbl_thumb.size() * dpr
+        image = self._pending_images.get(path)
+        if image is not None:
+            src = _bgr_to_pixmap(image)
+            pm = src.scaled(
+                target,
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+                scale_transform(src.size(), target),
             )
+            pm.setDevicePixelRatio(dpr)
+            self._lbl_thumb.setPixmap(pm)
+        elif path and os.path.isfile(path):
+            pm = cached_scaled_pixmap(path, self._lbl_thumb.size(), dpr)
             self._lbl_thumb.setPixmap(pm)
         else:
             self._lbl_thumb.clear()
@@ -530,9 +644,37 @@ class ButtonEditor(QWidget):
     # Region capture from screen
     # ═════════════════════════════════════════════════════════════
 
+    def _request_capture(self, callback, max_age: float = 0.5):
+        """
+        Call *callback(frame, pixmap)* with a full-screen capture.
+
+        The previous capture is reused if younger than *max_age* seconds;
+        otherwise the grab and pixel conversion run on the thread pool and
+        only ``QPixmap.fromImage`` happens on the GUI thread.
+        """
+        if self._last_capture is not None and time.monotonic() - self._last_capture[0] <= max_age:
+            callback(self._last_capture[1], self._last_capture[2])
+            return
+        first = not self._capture_callbacks
+        self._capture_callbacks.append(callback)
+        if first:
+            QThreadPool.globalInstance().start(_CaptureTask(self._capture, self._capture_ready))
+
+    def _on_capture_ready(self, frame, image):
+        callbacks, self._capture_callbacks = self._capture_callbacks, []
+        if frame is None:
+            QMessageBox.warning(self, tr("Capture Failed"), tr("Could not capture the screen."))
+            return
+        pm = QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
+        self._last_capture = (time.monotonic(), frame, pm)
+        for cb in callbacks:
+            cb(frame, pm)
+
     def _on_select_roi(self):
-        ss = self._capture.capture_full()
-        self._overlay = RegionCaptureOverlay(ss)
+        self._request_capture(self._show_roi_overlay)
+
+    def _show_roi_overlay(self, ss: np.ndarray, pm: QPixmap):
+        self._overlay = RegionCaptureOverlay(ss, pixmap=pm)
         self._overlay.region_selected.connect(self._on_roi_selected)
         self._overlay.show()
 
@@ -541,8 +683,10 @@ class ButtonEditor(QWidget):
 
     def _on_capture_from_screen(self):
         """Let the user draw a rectangle on the screen and save as button image."""
-        ss = self._capture.capture_full()
-        self._overlay = RegionCaptureOverlay(ss)
+        self._request_capture(self._show_capture_overlay)
+
+    def _show_capture_overlay(self, ss: np.ndarray, pm: QPixmap):
+        self._overlay = RegionCaptureOverlay(ss, pixmap=pm)
 
         def _handle_region(x, y, w, h):
             crop = ss[y: y + h, x: x + w]
@@ -550,12 +694,18 @@ class ButtonEditor(QWidget):
             save_dir.mkdir(parents=True, exist_ok=True)
             fname = f"capture_{uuid.uuid4().hex[:6]}.png"
             fpath = save_dir / fname
-            cv2.imwrite(str(fpath), crop)
-            self._add_button_from_image(str(fpath))
+            crop = np.ascontiguousarray(crop)
+            # Show the crop straight from memory; the PNG is written off-thread
+            self._add_button_from_image(str(fpath), crop)
+            QThreadPool.globalInstance().start(
+                _ImageWriteTask(str(fpath), crop, self._image_saved))
 
         self._overlay.region_selected.connect(_handle_region)
         self._overlay.show()
 
+    def _on_image_saved(self, path: str):
+        self._pending_images.pop(path, None)
+
     # ═════════════════════════════════════════════════════════════
     # Test recognition
     # ═════════════════════════════════════════════════════════════
@@ -571,7 +721,7 @@ class ButtonEditor(QWidget):
             return
 
         ss = self._capture.capture_full()
-        tpl = self._matcher.load_template(b.image_path)
+        tpl = _load_template_cached(b.image_path, os.path.getmtime(b.image_path))
         result = self._matcher.match(ss, tpl, confidence=b.confidence, region=b.region)
 
         if result.found and result.bounding_rect:
@@ -600,10 +750,16 @@ class ButtonEditor(QWidget):
         dlg.setWindowTitle(title)
         dlg.resize(800, 600)
         lbl = QLabel()
-        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        qimg = QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
-        pm = QPixmap.fromImage(qimg).scaled(780, 580, Qt.AspectRatioMode.KeepAspectRatio)
+        # Downsample the BGR buffer before handing it to Qt: INTER_AREA is
+        # cheaper than a Qt scale over the full-resolution pixmap.
+        h, w = image.shape[:2]
+        sf = min(780 / w, 580 / h)
+        if sf < 1.0:
+            image = cv2.resize(
+                image, (max(1, int(w * sf)), max(1, int(h * sf))),
+                interpolation=cv2.INTER_AREA,
+            )
+        pm = _bgr_to_pixmap(image)
         lbl.setPixmap(pm)
         layout = QVBoxLayout(dlg)
         layout.addWidget(lbl)
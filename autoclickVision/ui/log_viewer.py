@@ -7,14 +7,15 @@ per-round execution summaries, and log export (TXT / CSV).
 from __future__ import annotations
 
 import csv
+import itertools
 import logging
 import os
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Deque, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QSize, Qt, QTimer
 from PyQt6.QtWidgets import (
     QDialog,
     QFileDialog,
@@ -23,28 +24,96 @@ from PyQt6.QtWidgets import (
     QLabel,
     QListWidget,
     QListWidgetItem,
+    QPlainTextEdit,
     QPushButton,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from ..i18n import tr
+from .thumbnails import LazyThumbnailDelegate, cached_scaled_pixmap
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for log exports (1 MiB) so large logs go out in few syscalls
+_EXPORT_BUFFER = 1 << 20
+# How much of a historical log file the browser previews (its tail)
+_HISTORY_PREVIEW_BYTES = 1_000_000
+
+
+_READ_ONLY_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+class RoundSummaryModel(QAbstractTableModel):
+    """Read-only table of per-round (round, success, failure, skipped) counts."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Cells are stored pre-formatted; data() just indexes
+        self._rows: List[Tuple[str, str, str, str]] = []
+        self._headers = [tr("Round"), tr("Success"), tr("Failure"), tr("Skipped")]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 4
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return _READ_ONLY_FLAGS
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def append_row(self, row: Tuple[int, int, int, int]):
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(tuple(str(v) for v in row))
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
 
 class LogViewer(QWidget):
     """Panel showing real-time logs, screenshots on failure, and export controls."""
 
+    MAX_EXPORT_LINES = 100_000
+    MAX_VIEW_LINES = 5_000
+    FLUSH_INTERVAL_MS = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._log_lines: List[str] = []
+        # Bounded so week-long runs don't grow without limit; export keeps
+        # the newest MAX_EXPORT_LINES, the view the newest MAX_VIEW_LINES.
+        self._log_lines: Deque[str] = deque(maxlen=self.MAX_EXPORT_LINES)
         self._screenshots: List[Tuple[str, str]] = []  # (path, tag)
-        self._round_summaries: List[Tuple[int, int, int, int]] = []  # (round, ok, fail, skip)
+        # Lines received since the last flush; drained at most every
+        # FLUSH_INTERVAL_MS so a burst of log records costs one re-layout
+        # and one scrollbar update instead of one per line.  The timer only
+        # runs while something is pending, so an idle log costs no wakeups.
+        self._pending: List[str] = []
+        # True when lines arrived while the view was hidden
+        self._view_stale = False
+        # Lazily created screenshot preview window (reused)
+        self._preview_dlg: Optional[QDialog] = None
+        self._preview_lbl: Optional[QLabel] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
         self._build_ui()
 
     def _build_ui(self):
@@ -53,18 +122,25 @@ class LogViewer(QWidget):
         splitter = QSplitter(Qt.Orientation.Vertical)
 
         # Top: log text
-        self._text = QTextEdit()
+        # Plain-text widget: no rich-text layout per append, which matters
+        # when the scheduler logs in bursts
+        self._text = QPlainTextEdit()
         self._text.setReadOnly(True)
+        # Append-only log: undo history would just grow with every byte written
+        self._text.setUndoRedoEnabled(False)
+        self._text.setMaximumBlockCount(self.MAX_VIEW_LINES)
+        self._text.setCenterOnScroll(False)
+        self._text.installEventFilter(self)
         self._text.setFont(self._text.font())
-        self._text.setStyleSheet("QTextEdit { font-family: Consolas, monospace; font-size: 12px; }")
+        self._text.setStyleSheet("QPlainTextEdit { font-family: Consolas, monospace; font-size: 12px; }")
         splitter.addWidget(self._text)
 
         # Middle: round summary table
         grp_summary = QGroupBox(tr("Round Summary"))
         sl = QVBoxLayout(grp_summary)
-        self._summary_table = QTableWidget(0, 4)
-        self._summary_table.setHorizontalHeaderLabels(
-            [tr("Round"), tr("Success"), tr("Failure"), tr("Skipped")])
+        self._summary_model = RoundSummaryModel(self)
+        self._summary_table = QTableView()
+        self._summary_table.setModel(self._summary_model)
         self._summary_table.setMaximumHeight(140)
         self._summary_table.horizontalHeader().setStretchLastSection(True)
         sl.addWidget(self._summary_table)
@@ -74,6 +150,9 @@ class LogViewer(QWidget):
         self._screenshot_list = QListWidget()
         self._screenshot_list.setMaximumHeight(150)
         self._screenshot_list.setIconSize(self._screenshot_list.iconSize())
+        # Icons are decoded on demand as rows scroll into view
+        self._screenshot_list.setItemDelegate(
+            LazyThumbnailDelegate(QSize(64, 64), self._screenshot_list))
         self._screenshot_list.itemDoubleClicked.connect(self._on_screenshot_double_click)
         splitter.addWidget(self._screenshot_list)
 
@@ -104,19 +183,61 @@ class LogViewer(QWidget):
     # ═════════════════════════════════════════════════════════════
 
     def append_log(self, msg: str):
-        self._log_lines.append(msg)
-        self._text.append(msg)
-        # Auto-scroll
+        self.append_batch((msg,))
+
+    def append_batch(self, lines):
+        """Append several log lines with a single view update."""
+        self._log_lines.extend(lines)
+        if not self._text.isVisible():
+            # Nobody is looking: keep the history only and rebuild the view
+            # from it when it is shown again.
+            self._view_stale = True
+            return
+        self._pending.extend(lines)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def eventFilter(self, obj, event):
+        if obj is self._text and event.type() == QEvent.Type.Show and self._view_stale:
+            self._reload_view()
+        return super().eventFilter(obj, event)
+
+    def _reload_view(self):
+        """Repopulate the text view from the tail of the history in one call."""
+        self._view_stale = False
+        self._pending.clear()
+        self._flush_timer.stop()
+        n = min(self.MAX_VIEW_LINES, len(self._log_lines))
+        tail = itertools.islice(self._log_lines, len(self._log_lines) - n, None)
+        self._text.setPlainText("\n".join(tail))
         sb = self._text.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def _flush_pending(self):
+        if not self._pending:
+            return
+        sb = self._text.verticalScrollBar()
+        # Follow the tail only if the user hasn't scrolled up to read history
+        at_bottom = sb.value() >= sb.maximum() - 4
+        # A burst bigger than the view would only be laid out and then
+        # trimmed again by maximumBlockCount; insert just the visible tail.
+        self._text.appendPlainText("\n".join(self._pending[-self.MAX_VIEW_LINES:]))
+        self._pending.clear()
+        if at_bottom:
+            sb.setValue(sb.maximum())
+
     def clear_log(self):
         self._log_lines.clear()
+        self._pending.clear()
+        self._flush_timer.stop()
+        self._view_stale = False
+        # QPlainTextEdit.clear() swaps in an empty document (~1 ms for a full
+        # 5000-block view); shrinking setMaximumBlockCount to trim it instead
+        # is far slower, as it removes blocks one by one.
         self._text.clear()
         self._screenshots.clear()
-        self._screenshot_list.clear()
-        self._round_summaries.clear()
-        self._summary_table.setRowCount(0)
+        self._screenshot_list.clear()  # single model reset, not per-row removal
+        self._summary_model.clear()
 
     # ═════════════════════════════════════════════════════════════
     # Round summaries
@@ -124,13 +245,7 @@ class LogViewer(QWidget):
 
     def add_round_summary(self, round_num: int, success: int, failure: int, skipped: int):
         """Append a per-round summary row to the table."""
-        self._round_summaries.append((round_num, success, failure, skipped))
-        row = self._summary_table.rowCount()
-        self._summary_table.insertRow(row)
-        for col, val in enumerate([round_num, success, failure, skipped]):
-            item = QTableWidgetItem(str(val))
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self._summary_table.setItem(row, col, item)
+        self._summary_model.append_row((round_num, success, failure, skipped))
         # Auto-scroll to the newest row
         self._summary_table.scrollToBottom()
 
@@ -143,25 +258,26 @@ class LogViewer(QWidget):
         item = QListWidgetItem()
         item.setText(f"[{tag}] {Path(path).name}")
         item.setData(Qt.ItemDataRole.UserRole, path)
-        # Try to set a small icon
-        if os.path.isfile(path):
-            pm = QPixmap(path).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio)
-            from PyQt6.QtGui import QIcon
-            item.setIcon(QIcon(pm))
         self._screenshot_list.addItem(item)
 
     def _on_screenshot_double_click(self, item: QListWidgetItem):
         path = item.data(Qt.ItemDataRole.UserRole)
         if path and os.path.isfile(path):
-            dlg = QDialog(self)
-            dlg.setWindowTitle(tr("Screenshot"))
-            dlg.resize(800, 600)
-            lbl = QLabel()
-            pm = QPixmap(path).scaled(780, 580, Qt.AspectRatioMode.KeepAspectRatio)
-            lbl.setPixmap(pm)
-            layout = QVBoxLayout(dlg)
-            layout.addWidget(lbl)
-            dlg.exec()
+            # One modeless preview window, re-targeted on each double-click
+            if self._preview_dlg is None:
+                self._preview_dlg = QDialog(self)
+                self._preview_dlg.setWindowTitle(tr("Screenshot"))
+                self._preview_dlg.resize(800, 600)
+                self._preview_lbl = QLabel()
+                layout = QVBoxLayout(self._preview_dlg)
+                layout.addWidget(self._preview_lbl)
+            # Shrink-on-load decode, cached in QPixmapCache across opens
+            pm = cached_scaled_pixmap(
+                path, QSize(780, 580), self._preview_lbl.devicePixelRatioF())
+            self._preview_lbl.setPixmap(pm)
+            self._preview_dlg.show()
+            self._preview_dlg.raise_()
+            self._preview_dlg.activateWindow()
 
     # ═════════════════════════════════════════════════════════════
     # Export
@@ -170,17 +286,17 @@ class LogViewer(QWidget):
     def _on_export_txt(self):
         path, _ = QFileDialog.getSaveFileName(self, tr("Export Log"), "", tr("Text Files (*.txt)"))
         if path:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("\n".join(self._log_lines))
+            with open(path, "w", encoding="utf-8", buffering=_EXPORT_BUFFER) as f:
+                # Streamed line by line: no joined copy of the whole history
+                f.writelines(line + "\n" for line in self._log_lines)
 
     def _on_export_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, tr("Export Log"), "", tr("CSV Files (*.csv)"))
         if path:
-            with open(path, "w", encoding="utf-8", newline="") as f:
+            with open(path, "w", encoding="utf-8", newline="", buffering=_EXPORT_BUFFER) as f:
                 writer = csv.writer(f)
                 writer.writerow(["line", "message"])
-                for i, line in enumerate(self._log_lines, 1):
-                    writer.writerow([i, line])
+                writer.writerows(enumerate(self._log_lines, 1))
 
     # ═════════════════════════════════════════════════════════════
     # Historical run browser
@@ -213,22 +329,45 @@ class LogViewer(QWidget):
             file_list.addItem(fp.name)
         layout.addWidget(file_list)
 
-        preview = QTextEdit()
+        preview = QPlainTextEdit()
         preview.setReadOnly(True)
-        preview.setStyleSheet("QTextEdit { font-family: Consolas, monospace; font-size: 11px; }")
+        preview.setUndoRedoEnabled(False)
+        preview.document().setMaximumBlockCount(20_000)
+        preview.setStyleSheet("QPlainTextEdit { font-family: Consolas, monospace; font-size: 11px; }")
+        preview_note = QLabel()
+        preview_note.setVisible(False)
+        layout.addWidget(preview_note)
         layout.addWidget(preview)
 
+        def _selected_path():
+            item = file_list.currentItem()
+            return logs_dir / item.text() if item is not None else None
+
         def _on_select():
-            items = file_list.selectedItems()
-            if not items:
+            fpath = _selected_path()
+            if fpath is None:
                 return
-            fname = items[0].text()
-            fpath = logs_dir / fname
             try:
-                content = fpath.read_text(encoding="utf-8", errors="replace")
+                # Only the tail of large logs is shown; that's where a run ends
+                size = os.path.getsize(fpath)
+                truncated = size > _HISTORY_PREVIEW_BYTES
+                with open(fpath, "rb") as f:
+                    if truncated:
+                        # Start one byte early so readline() drops exactly the
+                        # partial line the seek landed in
+                        f.seek(size - _HISTORY_PREVIEW_BYTES - 1)
+                        f.readline()
+                    content = f.read().decode("utf-8", errors="replace")
                 preview.setPlainText(content)
+                preview_note.setText(
+                    tr("Preview shows only the last {0} KB of {1} KB.").format(
+                        _HISTORY_PREVIEW_BYTES // 1024, size // 1024
+                    )
+                )
+                preview_note.setVisible(truncated)
             except Exception as e:
                 preview.setPlainText(f"Error reading file: {e}")
+                preview_note.setVisible(False)
 
         file_list.currentItemChanged.connect(lambda *_: _on_select())
 
@@ -237,11 +376,20 @@ class LogViewer(QWidget):
         btn_close.clicked.connect(dlg.accept)
         btn_load = QPushButton(tr("Load into viewer"))
         def _load():
-            text = preview.toPlainText()
-            if text:
-                self.clear_log()
-                for line in text.splitlines():
-                    self.append_log(line)
+            # Re-read the whole file; the preview may only hold its tail
+            fpath = _selected_path()
+            if fpath is not None:
+                try:
+                    with open(fpath, "r", encoding="utf-8", errors="replace") as f:
+                        self.clear_log()
+                        lines = (line.rstrip("\r\n") for line in f)
+                        while True:
+                            batch = list(itertools.islice(lines, 5000))
+                            if not batch:
+                                break
+                            self.append_batch(batch)
+                except OSError as e:
+                    self.append_log(f"Error reading file: {e}")
             dlg.accept()
         btn_load.clicked.connect(_load)
         btn_row.addWidget(btn_load)
@@ -6,18 +6,21 @@ log viewer, status bar, progress bar, system-tray icon, and global hotkeys toget
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import queue
 import sys
+import threading
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 
-import keyboard
+import cv2
 import numpy as np
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QObject
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtCore import QAbstractNativeEventFilter, QRunnable, QThreadPool, QTimer, Qt, pyqtSignal, QObject
+from PyQt6.QtGui import QAction, QIcon, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -29,6 +32,7 @@ from PyQt6.QtWidgets import (
     QProgressBar,
     QSplitter,
     QStatusBar,
+    QStyle,
     QSystemTrayIcon,
     QTabWidget,
     QToolBar,
@@ -51,7 +55,8 @@ from ..i18n import tr, get_language, set_language, save_preference
 
 logger = logging.getLogger(__name__)
 
-_LOGS_DIR = Path(__file__).resolve().parent.parent / "logs"
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_LOGS_DIR = _PACKAGE_DIR / "logs"
 _SCREENSHOTS_DIR = _LOGS_DIR / "screenshots"
 _SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -61,11 +66,193 @@ _SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 # ──────────────────────────────────────────────────────────────────
 
 class _SignalBridge(QObject):
-    log_signal = pyqtSignal(str)
-    state_signal = pyqtSignal(str)
-    stats_signal = pyqtSignal(object)
-    failure_screenshot_signal = pyqtSignal(object, str)
+    """
+    Carries scheduler/watchdog callbacks onto the Qt thread.
+
+    Log lines and stats are the chatty ones: they are buffered here under a
+    lock and only the first item of a burst posts a (queued) signal, so a
+    fast click loop costs one Qt event per drain instead of one per line.
+    """
+
+    logs_ready = pyqtSignal()  # payload via take_logs()
+    state_signal = pyqtSignal(object)  # TaskState
+    stats_ready = pyqtSignal()  # payload via take_stats()
     tray_message_signal = pyqtSignal(str, str, int)  # title, message, icon_type
+    screenshot_saved_signal = pyqtSignal(str, str)  # path, tag
+    watchdog_restart_signal = pyqtSignal()
+    chain_task_signal = pyqtSignal(str)  # config path
+    # One event per round (never coalesced like stats): round, ✔, ✖, ⏭
+    round_summary_signal = pyqtSignal(int, int, int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._logs: List[str] = []
+        self._stats: Optional[RunStats] = None
+
+    def post_log(self, msg: str):
+        with self._lock:
+            self._logs.append(msg)
+            first = len(self._logs) == 1
+        if first:
+            self.logs_ready.emit()
+
+    def take_logs(self) -> List[str]:
+        with self._lock:
+            logs, self._logs = self._logs, []
+        return logs
+
+    def post_stats(self, stats: RunStats):
+        # The scheduler reports one live RunStats object, so keeping only the
+        # latest reference loses nothing.
+        with self._lock:
+            first = self._stats is None
+            self._stats = stats
+        if first:
+            self.stats_ready.emit()
+
+    def take_stats(self) -> Optional[RunStats]:
+        with self._lock:
+            stats, self._stats = self._stats, None
+        return stats
+
+
+class _WebhookTask(QRunnable):
+    """Deliver a webhook notification without blocking the calling thread."""
+
+    def __init__(self, notifier: WebhookNotifier, message: str, log):
+        super().__init__()
+        self._notifier = notifier
+        self._message = message
+        self._log = log
+
+    def run(self):
+        for name, ok in self._notifier.notify(self._message).items():
+            if not ok:
+                self._log(f"Webhook '{name}' delivery failed")
+
+
+class _ScreenshotWriter:
+    """
+    Bounded queue of failure screenshots drained by at most *workers*
+    pool threads.
+
+    Each worker keeps pulling frames until the queue is empty, so a burst
+    of failures is handled by the same already-running threads rather than
+    one task per frame.  The backlog is capped: full-screen frames are
+    several MB each, and during a bad run it is better to drop a few than
+    to let memory grow without bound.
+    """
+
+    # libpng level 3 is ~3× faster than OpenCV's default and only slightly larger
+    _PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 3]
+
+    def __init__(self, done, workers: int = 2, backlog: int = 32):
+        self._done = done  # signal(path, tag), emitted after each write
+        self._queue: "queue.Queue[Tuple[np.ndarray, Path, str]]" = queue.Queue(maxsize=backlog)
+        self._lock = threading.Lock()
+        self._running = 0
+        self._workers = workers
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(workers)
+
+    def submit(self, image: np.ndarray, path: Path, tag: str) -> bool:
+        """Queue a frame for writing; returns False if the backlog is full."""
+        try:
+            self._queue.put_nowait((image, path, tag))
+        except queue.Full:
+            return False
+        with self._lock:
+            start = self._running < self._workers
+            if start:
+                self._running += 1
+        if start:
+            self._pool.start(self._drain)
+        return True
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def _drain(self):
+        while True:
+            try:
+                image, path, tag = self._queue.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    # Re-check under the lock so a frame queued while we were
+                    # deciding to exit is never stranded.
+                    if self._queue.empty():
+                        self._running -= 1
+                        return
+                continue
+            self._write(image, path, tag)
+
+    def _write(self, image: np.ndarray, path: Path, tag: str):
+        ok, buf = cv2.imencode(".png", image, self._PNG_PARAMS)
+        if not ok:
+            logger.error("Failed to encode failure screenshot %s", path)
+            return
+        try:
+            path.write_bytes(buf.tobytes())
+        except OSError as e:
+            logger.error("Failed to write failure screenshot %s: %s", path, e)
+            return
+        self._done.emit(str(path), tag)
+
+
+# ──────────────────────────────────────────────────────────────────
+# Global hotkeys (Windows)
+# ──────────────────────────────────────────────────────────────────
+
+_WM_HOTKEY = 0x0312
+_MOD_NOREPEAT = 0x4000
+_VK_CODES = {"F9": 0x78, "F10": 0x79, "F11": 0x7A}
+
+
+class _Win32HotkeyFilter(QAbstractNativeEventFilter):
+    """
+    System-wide hotkeys via ``RegisterHotKey``.
+
+    Windows posts ``WM_HOTKEY`` into the GUI thread's message queue, so the
+    hotkeys arrive through Qt's own event loop: no hook thread, no polling.
+    """
+
+    def __init__(self, on_hotkey):
+        super().__init__()
+        self._on_hotkey = on_hotkey
+        self._hwnd = 0
+        self._actions: Dict[int, str] = {}  # hotkey id → action
+
+    def register(self, hwnd: int, hotkeys) -> bool:
+        import ctypes
+        user32 = ctypes.windll.user32
+        self.unregister()
+        self._hwnd = hwnd
+        for hk_id, (key, action) in enumerate(hotkeys, start=1):
+            if not user32.RegisterHotKey(hwnd, hk_id, _MOD_NOREPEAT, _VK_CODES[key]):
+                self.unregister()
+                return False
+            self._actions[hk_id] = action
+        return True
+
+    def unregister(self):
+        if not self._actions:
+            return
+        import ctypes
+        for hk_id in self._actions:
+            ctypes.windll.user32.UnregisterHotKey(self._hwnd, hk_id)
+        self._actions.clear()
+
+    def nativeEventFilter(self, event_type, message):
+        if self._actions and event_type == b"windows_generic_MSG":
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            action = self._actions.get(msg.wParam) if msg.message == _WM_HOTKEY else None
+            if action is not None:
+                # Leave the native filter before running the slot
+                QTimer.singleShot(0, functools.partial(self._on_hotkey, action))
+                return True, 0
+        return False, 0
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -75,6 +262,9 @@ class _SignalBridge(QObject):
 class MainWindow(QMainWindow):
     """Application main window."""
 
+    _HEARTBEAT_MIN_INTERVAL_NS = 200_000_000
+    _TRAY_MIN_INTERVAL_NS = 3_000_000_000
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(tr("AutoClick Vision"))
@@ -96,6 +286,7 @@ class MainWindow(QMainWindow):
             "scale_step": 0.05,
             "use_bezier": False,
             "use_directinput": False,
+            "global_hotkeys": True,
             "archive_screenshots": True,
             "failure_rate_threshold": 0.5,
             "failure_rate_window": 20,
@@ -103,9 +294,13 @@ class MainWindow(QMainWindow):
             "stop_after_consecutive_failures": 0,
             "stop_after_duration_minutes": 0,
         }
+        # Attribute view of _settings, rebuilt whenever the dialog applies
+        self._settings_ns = SimpleNamespace(**self._settings)
 
         # Webhook notifier
         self.webhook_notifier = WebhookNotifier()
+        self._notify_pool = QThreadPool(self)
+        self._notify_pool.setMaxThreadCount(4)
 
         # Failure-rate monitor
         self.failure_monitor = FailureRateMonitor(
@@ -114,26 +309,71 @@ class MainWindow(QMainWindow):
             on_alert=self._on_failure_rate_alert,
         )
 
-        self._last_summary_round: int = 0
+        # Task most recently handed to the scheduler (for watchdog restarts)
+        self._current_task: Optional[TaskConfig] = None
+
+        # Shared non-blocking open/save config dialog (see _show_config_dialog)
+        self._config_dialog: Optional[QFileDialog] = None
+        self._config_dialog_action = None
+        # Settings dialog, kept after its first open and reloaded on each
+        # later one (see _on_settings)
+        self._settings_dialog: Optional[SettingsDialog] = None
+
+        # Last background tray balloon (see _on_tray_message)
+        self._last_tray_ns: int = time.monotonic_ns() - self._TRAY_MIN_INTERVAL_NS
+
+        # Last time log traffic was reported to the watchdog (see _on_logs_ready)
+        self._last_heartbeat_ns: int = 0
+
+        # Coalesced status-bar refresh (see _on_stats_update); _status_cache
+        # holds what each status widget currently shows so unchanged values
+        # skip the Qt call entirely.
+        self._status_cache: Dict[str, object] = {}
+        self._pending_stats: Optional[RunStats] = None
+        # Armed on demand rather than free-running, so it costs nothing while
+        # idle; ~15 Hz is plenty for counters read by a human.
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._stats_timer.setInterval(66)
+        self._stats_timer.timeout.connect(self._render_stats)
 
         # Signal bridge
         self._bridge = _SignalBridge()
-        self._bridge.log_signal.connect(self._on_log)
+        self._bridge.logs_ready.connect(self._on_logs_ready)
         self._bridge.state_signal.connect(self._on_state_change)
-        self._bridge.stats_signal.connect(self._on_stats_update)
-        self._bridge.failure_screenshot_signal.connect(self._on_failure_screenshot)
+        self._bridge.stats_ready.connect(self._on_stats_ready)
         self._bridge.tray_message_signal.connect(self._on_tray_message)
+        self._bridge.screenshot_saved_signal.connect(self._on_screenshot_saved)
+        self._bridge.watchdog_restart_signal.connect(self._on_watchdog_restart)
+        self._bridge.chain_task_signal.connect(self._on_chain_task)
+        self._bridge.round_summary_signal.connect(self._on_round_summary)
+
+        # Failure screenshot naming state (see _on_failure_screenshot)
+        self._ts_lock = threading.Lock()
+        self._ts_epoch: int = 0
+        self._ts_prefix: str = ""
+        self._ts_counter: int = 0
+
+        # Failure screenshots are PNG-encoded and written off the Qt thread
+        self._screenshot_writer = _ScreenshotWriter(self._bridge.screenshot_saved_signal)
 
         self.scheduler = SequenceScheduler(
             capture=self.capture,
             matcher=self.matcher,
             clicker=self.clicker,
-            on_log=lambda msg: self._bridge.log_signal.emit(msg),
-            on_state_change=lambda s: self._bridge.state_signal.emit(s.value),
-            on_stats_update=lambda s: self._bridge.stats_signal.emit(s),
-            on_failure_screenshot=lambda img, tag: self._bridge.failure_screenshot_signal.emit(img, tag),
-            on_chain_task=self._on_chain_task,
+            # Bound signal emitters: no extra Python frame per scheduler event.
+            # The bridge lives on the Qt thread, so delivery is queued.
+            on_log=self._bridge.post_log,
+            on_state_change=self._bridge.state_signal.emit,
+            on_stats_update=self._bridge.post_stats,
+            # Called on the scheduler thread: frames go straight to the
+            # writer and only (path, tag) ever crosses to the Qt thread.
+            on_failure_screenshot=self._on_failure_screenshot,
+            # Chaining reloads the editors, so it must run on the Qt thread
+            on_chain_task=self._bridge.chain_task_signal.emit,
             on_recognition_result=self._on_recognition_result,
+            on_round_summary=self._bridge.round_summary_signal.emit,
         )
 
         self.watchdog = Watchdog(
@@ -147,7 +387,11 @@ class MainWindow(QMainWindow):
         self._build_central()
         self._build_statusbar()
         self._build_tray_icon()
+        self._hotkey_filter: Optional[_Win32HotkeyFilter] = None
+        self._shortcuts: List[QShortcut] = []
         self._register_hotkeys()
+        # System-wide registrations outlive the window unless released
+        QApplication.instance().aboutToQuit.connect(self._unregister_hotkeys)
 
     # ═════════════════════════════════════════════════════════════
     # UI construction
@@ -158,31 +402,37 @@ class MainWindow(QMainWindow):
         tb.setMovable(False)
         self.addToolBar(tb)
 
-        self._act_start = QAction(tr("▶ Start"), self)
+        # Style-provided icons instead of emoji labels: drawn natively at any
+        # DPI and no fallback-font text shaping on every toolbar repaint
+        tb.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        icon = self.style().standardIcon
+        sp = QStyle.StandardPixmap
+
+        self._act_start = QAction(icon(sp.SP_MediaPlay), tr("Start"), self)
         self._act_start.triggered.connect(self._on_start)
         tb.addAction(self._act_start)
 
-        self._act_pause = QAction(tr("⏸ Pause"), self)
+        self._act_pause = QAction(icon(sp.SP_MediaPause), tr("Pause"), self)
         self._act_pause.triggered.connect(self._on_pause)
         self._act_pause.setEnabled(False)
         tb.addAction(self._act_pause)
 
-        self._act_stop = QAction(tr("⏹ Stop"), self)
+        self._act_stop = QAction(icon(sp.SP_MediaStop), tr("Stop"), self)
         self._act_stop.triggered.connect(self._on_stop)
         self._act_stop.setEnabled(False)
         tb.addAction(self._act_stop)
 
         tb.addSeparator()
 
-        act_open = QAction(tr("📂 Open"), self)
+        act_open = QAction(icon(sp.SP_DialogOpenButton), tr("Open"), self)
         act_open.triggered.connect(self._on_open_config)
         tb.addAction(act_open)
 
-        act_save = QAction(tr("💾 Save"), self)
+        act_save = QAction(icon(sp.SP_DialogSaveButton), tr("Save"), self)
         act_save.triggered.connect(self._on_save_config)
         tb.addAction(act_save)
 
-        act_save_as = QAction(tr("📄 Save As…"), self)
+        act_save_as = QAction(icon(sp.SP_FileIcon), tr("Save As…"), self)
         act_save_as.triggered.connect(self._on_save_as_config)
         tb.addAction(act_save_as)
 
@@ -265,12 +515,18 @@ class MainWindow(QMainWindow):
         self._tray.show()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _load_app_icon() -> QIcon:
-        """Try several candidate paths and load via QPixmap for reliability."""
+        """
+        Return the application icon, resolved once.  Reuses the icon
+        ``main()`` already set on the QApplication; otherwise tries several
+        candidate paths and loads via QPixmap for reliability.
+        """
+        icon = QApplication.windowIcon()
+        if not icon.isNull():
+            return icon
         from PyQt6.QtGui import QPixmap
-        base = Path(__file__).resolve().parent.parent
-        for rel in ("assets/icon.ico", "icon.ico", "assets/icon.png"):
-            p = base / rel
+        for p in (_PACKAGE_DIR / rel for rel in ("assets/icon.ico", "icon.ico", "assets/icon.png")):
             if p.exists():
                 pm = QPixmap(str(p))
                 if not pm.isNull():
@@ -281,13 +537,40 @@ class MainWindow(QMainWindow):
     # Global hotkeys
     # ═════════════════════════════════════════════════════════════
 
+    _HOTKEYS = (("F9", "start"), ("F10", "pause"), ("F11", "stop"))
+
     def _register_hotkeys(self):
-        try:
-            keyboard.add_hotkey("F9", self._on_start)
-            keyboard.add_hotkey("F10", self._on_pause)
-            keyboard.add_hotkey("F11", self._on_stop)
-        except Exception as e:
-            logger.warning("Could not register global hotkeys: %s", e)
+        """
+        Bind F9/F10/F11.  With ``global_hotkeys`` on (the default, so a run
+        can be stopped while another window has focus) Windows gets
+        system-wide ``RegisterHotKey`` bindings delivered through the Qt
+        message pump; elsewhere, or if registration fails, application-wide
+        ``QShortcut``s are used.
+        """
+        self._unregister_hotkeys()
+        if self._settings.get("global_hotkeys", True) and sys.platform == "win32":
+            if self._hotkey_filter is None:
+                self._hotkey_filter = _Win32HotkeyFilter(self._on_hotkey)
+                QApplication.instance().installNativeEventFilter(self._hotkey_filter)
+            if self._hotkey_filter.register(int(self.winId()), self._HOTKEYS):
+                return
+            logger.warning("Could not register global hotkeys; using in-app shortcuts")
+        for key, action in self._HOTKEYS:
+            sc = QShortcut(QKeySequence(key), self)
+            sc.setContext(Qt.ShortcutContext.ApplicationShortcut)
+            sc.activated.connect(functools.partial(self._on_hotkey, action))
+            self._shortcuts.append(sc)
+
+    def _unregister_hotkeys(self):
+        if self._hotkey_filter is not None:
+            self._hotkey_filter.unregister()
+        for sc in self._shortcuts:
+            sc.setEnabled(False)
+            sc.deleteLater()
+        self._shortcuts.clear()
+
+    def _on_hotkey(self, action: str):
+        {"start": self._on_start, "pause": self._on_pause, "stop": self._on_stop}[action]()
 
     def _sync_buttons_to_task(self):
         """Push the button editor's current list into the shared task config
@@ -315,6 +598,8 @@ class MainWindow(QMainWindow):
     def _build_task_config(self) -> TaskConfig:
         """Collect the current UI state into a TaskConfig."""
         task = self.config_mgr.task or TaskConfig()
+        # Both editors return shallow copies of the lists they edit (no
+        # widget walk), so re-reading them here is cheap and never stale.
         task.buttons = self.button_editor.get_button_configs()
         task.steps = self.sequence_editor.get_step_configs()
         seq_settings = self.sequence_editor.get_loop_settings()
@@ -322,22 +607,20 @@ class MainWindow(QMainWindow):
         task.round_interval = seq_settings.get("round_interval", 10.0)
         task.scheduled_start = seq_settings.get("scheduled_start")
         # Apply matcher settings from the settings dialog
-        self.matcher.grayscale = self._settings.get("grayscale", False)
-        self.matcher.multi_scale = self._settings.get("multi_scale", False)
-        self.matcher.scale_range = (
-            self._settings.get("scale_min", 0.7),
-            self._settings.get("scale_max", 1.3),
-        )
-        self.matcher.scale_step = self._settings.get("scale_step", 0.05)
+        st = self._settings_ns
+        self.matcher.grayscale = st.grayscale
+        self.matcher.multi_scale = st.multi_scale
+        self.matcher.scale_range = (st.scale_min, st.scale_max)
+        self.matcher.scale_step = st.scale_step
         # Apply clicker settings
-        self.clicker.use_bezier = self._settings.get("use_bezier", False)
+        self.clicker.use_bezier = st.use_bezier
         # Update failure monitor parameters
-        self.failure_monitor.threshold = self._settings.get("failure_rate_threshold", 0.5)
-        self.failure_monitor.window = self._settings.get("failure_rate_window", 20)
+        self.failure_monitor.threshold = st.failure_rate_threshold
+        self.failure_monitor.window = st.failure_rate_window
         self.failure_monitor.reset()
         # Stop conditions
-        task.stop_after_consecutive_failures = self._settings.get("stop_after_consecutive_failures", 0)
-        task.stop_after_duration_minutes = self._settings.get("stop_after_duration_minutes", 0)
+        task.stop_after_consecutive_failures = st.stop_after_consecutive_failures
+        task.stop_after_duration_minutes = st.stop_after_duration_minutes
         return task
 
     def _on_start(self):
@@ -350,7 +633,7 @@ class MainWindow(QMainWindow):
             return
         # Sync webhook registrations
         self._sync_webhooks()
-        self._last_summary_round = 0
+        self._current_task = task
         self.scheduler.start(task)
         self.watchdog.start()
         self._act_start.setEnabled(False)
@@ -374,18 +657,48 @@ class MainWindow(QMainWindow):
     # Config I/O slots
     # ═════════════════════════════════════════════════════════════
 
+    def _show_config_dialog(self, accept_mode: QFileDialog.AcceptMode, title: str,
+                            name_filter: str, on_selected):
+        """
+        Show the shared open/save config dialog without blocking, and call
+        *on_selected(path)* once a file is picked.  The dialog is created
+        once and reused, so it also remembers the last directory.
+        """
+        dlg = self._config_dialog
+        if dlg is None:
+            dlg = QFileDialog(self)
+            dlg.setDefaultSuffix("json")
+            dlg.fileSelected.connect(self._on_config_file_selected)
+            self._config_dialog = dlg
+        self._config_dialog_action = on_selected
+        dlg.setAcceptMode(accept_mode)
+        dlg.setFileMode(
+            QFileDialog.FileMode.ExistingFile
+            if accept_mode == QFileDialog.AcceptMode.AcceptOpen
+            else QFileDialog.FileMode.AnyFile
+        )
+        dlg.setWindowTitle(title)
+        dlg.setNameFilter(name_filter)
+        dlg.open()
+
+    def _on_config_file_selected(self, path: str):
+        if path and self._config_dialog_action is not None:
+            self._config_dialog_action(path)
+
     def _on_open_config(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, tr("Open Config"), "", tr("Config Files (*.json *.yaml *.yml)")
+        self._show_config_dialog(
+            QFileDialog.AcceptMode.AcceptOpen, tr("Open Config"),
+            tr("Config Files (*.json *.yaml *.yml)"), self._load_config,
         )
-        if path:
-            try:
-                task = self.config_mgr.load(path)
-                self.button_editor.load_from_task(task)
-                self.sequence_editor.load_from_task(task)
-                self.log_viewer.append_log(f"Config loaded: {path}")
-            except Exception as e:
-                QMessageBox.critical(self, tr("Error"), str(e))
+
+    def _load_config(self, path: str):
+        try:
+            task = self.config_mgr.load(path)
+            self.button_editor.load_from_task(task)
+            self.sequence_editor.load_from_task(task)
+            self.log_viewer.append_log(f"Config loaded: {path}")
+        except Exception as e:
+            QMessageBox.critical(self, tr("Error"), str(e))
 
     def _on_save_config(self):
         try:
@@ -399,29 +712,38 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, tr("Error"), str(e))
 
     def _on_save_as_config(self):
-        path, _ = QFileDialog.getSaveFileName(
-            self, tr("Save Config As"), "", tr("JSON (*.json);;YAML (*.yaml)")
+        self._show_config_dialog(
+            QFileDialog.AcceptMode.AcceptSave, tr("Save Config As"),
+            tr("JSON (*.json);;YAML (*.yaml)"), self._save_config_as,
         )
-        if path:
-            try:
-                self.config_mgr.set_task(self._build_task_config())
-                self.config_mgr.save(path)
-                self.log_viewer.append_log(f"Config saved: {path}")
-            except Exception as e:
-                QMessageBox.critical(self, tr("Error"), str(e))
+
+    def _save_config_as(self, path: str):
+        try:
+            self.config_mgr.set_task(self._build_task_config())
+            self.config_mgr.save(path)
+            self.log_viewer.append_log(f"Config saved: {path}")
+        except Exception as e:
+            QMessageBox.critical(self, tr("Error"), str(e))
 
     # ═════════════════════════════════════════════════════════════
     # Scheduler callbacks (arrive on Qt thread via signal bridge)
     # ═════════════════════════════════════════════════════════════
 
-    def _on_log(self, msg: str):
-        self.log_viewer.append_log(msg)
-        self.watchdog.heartbeat()
-        self.watchdog.report_activity()
-
-    def _on_state_change(self, state_value: str):
-        state = TaskState(state_value)
-        self._lbl_state.setText(state.value.capitalize())
+    def _on_logs_ready(self):
+        lines = self._bridge.take_logs()
+        if not lines:
+            return
+        self.log_viewer.append_batch(lines)
+        # The watchdog thresholds are tens of seconds; telling it about
+        # activity more than every 200 ms adds nothing.
+        now = time.monotonic_ns()
+        if now - self._last_heartbeat_ns > self._HEARTBEAT_MIN_INTERVAL_NS:
+            self._last_heartbeat_ns = now
+            self.watchdog.heartbeat()
+            self.watchdog.report_activity()
+
+    def _on_state_change(self, state: TaskState):
+        self._set_status_text("state", self._lbl_state, state.value.capitalize())
         if state in (TaskState.FINISHED, TaskState.STOPPED, TaskState.ERROR):
             self._act_start.setEnabled(True)
             self._act_pause.setEnabled(False)
@@ -432,49 +754,101 @@ class MainWindow(QMainWindow):
                     tr("AutoClick Vision"), tr("Task finished!"),
                     QSystemTrayIcon.MessageIcon.Information.value,
                 )
-                self.webhook_notifier.notify("Task finished")
+                self._notify_async("Task finished")
             elif state == TaskState.ERROR:
                 self._bridge.tray_message_signal.emit(
                     tr("AutoClick Vision"), tr("Task error!"),
                     QSystemTrayIcon.MessageIcon.Critical.value,
                 )
-                self.webhook_notifier.notify("Task error")
+                self._notify_async("Task error")
         elif state == TaskState.PAUSED:
             self._act_start.setEnabled(True)
             self._act_pause.setEnabled(True)
 
+    def _on_stats_ready(self):
+        stats = self._bridge.take_stats()
+        if stats is not None:
+            self._on_stats_update(stats)
+
     def _on_stats_update(self, stats: RunStats):
-        self._lbl_step.setText(f"Step: {stats.current_step}/{stats.total_steps}")
+        # Labels/progress are repainted at most every 66 ms from the latest
+        # stats.  Round summaries don't come from here: stats are coalesced,
+        # so they arrive separately via round_summary_signal.
+        self._pending_stats = stats
+        if not self._stats_timer.isActive():
+            self._stats_timer.start()
+
+    def _on_round_summary(self, round_num: int, success: int, failure: int, skipped: int):
+        self.log_viewer.add_round_summary(round_num, success, failure, skipped)
+
+    def _render_stats(self):
+        stats = self._pending_stats
+        if stats is None or not self.isVisible():
+            # Minimised to tray: keep the latest stats for showEvent
+            return
+        self._pending_stats = None
+        # The setText/setValue calls below only schedule repaints, which Qt
+        # merges into one paint event; wrapping them in setUpdatesEnabled()
+        # would instead force a full status-bar repaint on every tick, even
+        # when _status_cache skipped all of them.
+        self._set_status_text("step", self._lbl_step, f"Step: {stats.current_step}/{stats.total_steps}")
         total = stats.total_rounds if stats.total_rounds > 0 else "∞"
-        self._lbl_round.setText(f"Round: {stats.rounds_completed}/{total}")
+        self._set_status_text("round", self._lbl_round, f"Round: {stats.rounds_completed}/{total}")
         mins, secs = divmod(int(stats.elapsed), 60)
-        self._lbl_elapsed.setText(f"Elapsed: {mins}m {secs}s")
-        if stats.total_rounds > 0:
-            pct = int(stats.rounds_completed / stats.total_rounds * 100)
+        self._set_status_text("elapsed", self._lbl_elapsed, f"Elapsed: {mins}m {secs}s")
+        key = (stats.rounds_completed, stats.total_rounds)
+        if self._status_cache.get("pct") != key:
+            self._status_cache["pct"] = key
+            # Integer maths: int(29 / 100 * 100) would give 28
+            pct = stats.rounds_completed * 100 // stats.total_rounds if stats.total_rounds > 0 else 0
             self._progress.setValue(pct)
-        else:
-            self._progress.setValue(0)
-        # Emit per-round summary when a round completes
-        if stats.rounds_completed > self._last_summary_round:
-            self._last_summary_round = stats.rounds_completed
-            rs = stats.current_round_stats
-            self.log_viewer.add_round_summary(
-                stats.rounds_completed, rs.success, rs.failure, rs.skipped
-            )
+
+    def _set_status_text(self, key: str, label: QLabel, text: str):
+        if self._status_cache.get(key) != text:
+            self._status_cache[key] = text
+            label.setText(text)
 
     def _on_failure_screenshot(self, image: np.ndarray, tag: str):
-        """Save a failure screenshot and optionally archive it."""
-        if not self._settings.get("archive_screenshots", True):
+        """
+        Queue a failure screenshot for archiving.  Runs on whichever thread
+        reports the failure (normally the scheduler's); the writer announces
+        the saved file through ``screenshot_saved_signal``.
+        """
+        if not self._settings_ns.archive_screenshots:
             return
-        import cv2
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        fname = f"{ts}_{tag}.png"
+        # Timestamp prefix is formatted once per second; the counter keeps
+        # several failures within the same second from overwriting each other.
+        now = int(time.time())
+        with self._ts_lock:
+            if now != self._ts_epoch:
+                self._ts_epoch = now
+                self._ts_prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+                self._ts_counter = 0
+            self._ts_counter += 1
+            fname = f"{self._ts_prefix}_{self._ts_counter:03d}_{tag}.png"
         fpath = _SCREENSHOTS_DIR / fname
-        cv2.imwrite(str(fpath), image)
-        self.log_viewer.add_screenshot(str(fpath), tag)
+        # A strided view is compacted for the encoder; the usual contiguous
+        # capture is passed through as-is, so the writer shares the buffer
+        # with the scheduler.  That is safe because captured frames are
+        # fresh arrays that nothing writes to after capture.
+        image = np.ascontiguousarray(image)
+        if not self._screenshot_writer.submit(image, fpath, tag):
+            self._bridge.post_log(f"Screenshot backlog full, dropped {fname}")
+
+    def _on_screenshot_saved(self, path: str, tag: str):
+        self.log_viewer.add_screenshot(path, tag)
 
     def _on_tray_message(self, title: str, message: str, icon_type: int):
-        """Thread-safe tray notification (always runs on the Qt main thread)."""
+        """
+        Thread-safe tray notification (always runs on the Qt main thread).
+        At most one balloon per ``_TRAY_MIN_INTERVAL_NS``: a run flapping
+        between errors would otherwise flood the shell with notifications;
+        the log keeps the full record.
+        """
+        now = time.monotonic_ns()
+        if now - self._last_tray_ns < self._TRAY_MIN_INTERVAL_NS:
+            return
+        self._last_tray_ns = now
         self._tray.showMessage(title, message, QSystemTrayIcon.MessageIcon(icon_type))
 
     # ═════════════════════════════════════════════════════════════
@@ -483,9 +857,18 @@ class MainWindow(QMainWindow):
 
     def _on_settings(self):
         """Open the settings dialog and apply changes."""
-        dlg = SettingsDialog(self._settings, parent=self)
+        dlg = self._settings_dialog
+        if dlg is None:
+            dlg = self._settings_dialog = SettingsDialog(self._settings, parent=self)
+        else:
+            # Drops whatever a cancelled previous session left in the fields
+            dlg.load_settings(self._settings)
         if dlg.exec():
+            old_global = self._settings.get("global_hotkeys", True)
             self._settings.update(dlg.get_settings())
+            self._settings_ns = SimpleNamespace(**self._settings)
+            if self._settings.get("global_hotkeys", True) != old_global:
+                self._register_hotkeys()
             self.log_viewer.append_log(tr("Settings updated"))
 
     def _on_chain_task(self, path: str):
@@ -495,11 +878,12 @@ class MainWindow(QMainWindow):
             self.button_editor.load_from_task(task)
             self.sequence_editor.load_from_task(task)
             self.log_viewer.append_log(f"Chain task loaded: {path}")
+            self._current_task = task
             self.scheduler.start(task)
             self.watchdog.start()
         except Exception as e:
             logger.error("Chain task failed: %s", e)
-            self._bridge.log_signal.emit(f"Chain task error: {e}")
+            self.log_viewer.append_log(f"Chain task error: {e}")
 
     def _on_recognition_result(self, success: bool):
         """Feed the failure-rate monitor with each recognition outcome."""
@@ -509,19 +893,24 @@ class MainWindow(QMainWindow):
         """Called when the failure rate exceeds the configured threshold."""
         msg = f"High failure rate: {rate:.0%} ({failures}/{total})"
         logger.warning(msg)
-        self._bridge.log_signal.emit(f"[ALERT] {msg}")
+        self._bridge.post_log(f"[ALERT] {msg}")
         self._bridge.tray_message_signal.emit(
             "AutoClick Vision", msg,
             QSystemTrayIcon.MessageIcon.Warning.value,
         )
         # Notify via webhooks
-        self.webhook_notifier.notify(f"Failure-rate alert: {msg}")
+        self._notify_async(f"Failure-rate alert: {msg}")
         # Stop if consecutive-failure limit exceeded
         stop_limit = self._settings.get("stop_after_consecutive_failures", 0)
         if stop_limit > 0 and failures >= stop_limit:
-            self._bridge.log_signal.emit("[ALERT] Consecutive failure limit reached — stopping")
+            self._bridge.post_log("[ALERT] Consecutive failure limit reached — stopping")
             self.scheduler.stop()
 
+    def _notify_async(self, message: str):
+        """Send *message* to all webhooks on the notification pool (any thread)."""
+        self._notify_pool.start(
+            _WebhookTask(self.webhook_notifier, message, self._bridge.post_log))
+
     def _sync_webhooks(self):
         """Synchronise webhook URLs from settings into the notifier."""
         # Clear existing hooks and re-register from settings
@@ -537,30 +926,40 @@ class MainWindow(QMainWindow):
     # ═════════════════════════════════════════════════════════════
 
     def _on_watchdog_freeze(self):
-        self._bridge.log_signal.emit("[WATCHDOG] \u26a0 Freeze detected \u2014 attempting auto-restart")
+        self._bridge.post_log("[WATCHDOG] \u26a0 Freeze detected \u2014 attempting auto-restart")
         self._bridge.tray_message_signal.emit(
             "AutoClick Vision", "Watchdog: freeze detected \u2014 restarting!",
             QSystemTrayIcon.MessageIcon.Warning.value,
         )
-        # Auto-restart: stop + re-start the scheduler with the same task
-        if self.scheduler._task is not None:
-            task = self.scheduler._task
-            self.scheduler.stop()
-            self.watchdog.stop()
-            import time; time.sleep(0.3)
-            self.scheduler.start(task)
-            self.watchdog.start()
-            self._bridge.log_signal.emit("[WATCHDOG] \u21bb Task auto-restarted")
+        # Runs on the watchdog thread, which can't stop (join) itself:
+        # hand the restart to the Qt thread.
+        self._bridge.watchdog_restart_signal.emit()
+
+    def _on_watchdog_restart(self):
+        """Stop + re-start the scheduler with the task last started."""
+        if self._current_task is None:
+            return
+        self.scheduler.stop()
+        self.watchdog.stop()
+        # Give the old run a moment to wind down without blocking the event loop
+        QTimer.singleShot(300, self._restart_current_task)
+
+    def _restart_current_task(self):
+        if self._current_task is None:
+            return
+        self.scheduler.start(self._current_task)
+        self.watchdog.start()
+        self.log_viewer.append_log("[WATCHDOG] \u21bb Task auto-restarted")
 
     def _on_watchdog_inactivity(self):
-        self._bridge.log_signal.emit("[WATCHDOG] \u26a0 Prolonged screen inactivity")
+        self._bridge.post_log("[WATCHDOG] \u26a0 Prolonged screen inactivity")
         self._bridge.tray_message_signal.emit(
             "AutoClick Vision", "Watchdog: prolonged screen inactivity",
             QSystemTrayIcon.MessageIcon.Warning.value,
         )
 
     def _on_watchdog_exception(self, exc: Exception):
-        self._bridge.log_signal.emit(f"[WATCHDOG] ✖ Exception: {exc}")
+        self._bridge.post_log(f"[WATCHDOG] ✖ Exception: {exc}")
 
     # ═════════════════════════════════════════════════════════════
     # Tray / close overrides
@@ -571,6 +970,11 @@ class MainWindow(QMainWindow):
             self.showNormal()
             self.activateWindow()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_stats is not None:
+            self._stats_timer.start()
+
     def closeEvent(self, event):
         """Minimize to tray instead of closing."""
         event.ignore()
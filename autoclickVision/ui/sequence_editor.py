@@ -7,17 +7,26 @@ mode toggle, loop configuration, and schedule configuration.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import (
+    QAbstractListModel,
+    QDateTime,
     QEasingCurve,
+    QModelIndex,
     QParallelAnimationGroup,
     QPoint,
     QPropertyAnimation,
+    QSize,
     Qt,
+    QRunnable,
+    QThreadPool,
+    QTimer,
     pyqtSignal,
 )
+from PyQt6.QtGui import QColor, QPainter, QPen
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QComboBox,
     QDateTimeEdit,
@@ -27,14 +36,17 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
     QPlainTextEdit,
     QPushButton,
-    QScrollArea,
     QSpinBox,
     QStackedWidget,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
@@ -64,21 +76,43 @@ _CARD_COLORS = [
     ("#fff3e0", "#ff9800"),  # orange
 ]
 
+# One stylesheet for all cards, installed on the step list; each card just
+# flips its "cardColor"/"selected" properties instead of re-parsing its own QSS
+_CARD_QSS = "".join(
+    f'StepCard[cardColor="{i}"] {{ border: 1px solid {border}; border-radius: 6px; '
+    f'background: {bg}; padding: 4px; }}\n'
+    f'StepCard[cardColor="{i}"][selected="true"] {{ border: 2px solid {border}; }}\n'
+    for i, (bg, border) in enumerate(_CARD_COLORS)
+)
+
 
 class StepCard(QWidget):
-    """A compact card representing one sequence step."""
+    """
+    Edit form for one sequence step.  Steps are shown collapsed (painted by
+    ``StepCardDelegate``); a card is only built when its row becomes current.
+    """
 
     removed = pyqtSignal(object)
     changed = pyqtSignal()
-    selected = pyqtSignal(object)
 
-    def __init__(self, step: StepConfig, available_buttons: List[ButtonConfig],
-                 color_index: int = 0, parent=None):
+    def __init__(self, step: StepConfig, options: List[Tuple[str, str]],
+                 color_index: int = 0, selected: bool = False, parent=None):
         super().__init__(parent)
         self.step = step
-        self._buttons = available_buttons
+        # (label, id) pairs the button combo is built from; shared by all
+        # cards of one rebuild
+        self.options = options
         self._color_index = color_index % len(_CARD_COLORS)
-        self._selected = False
+        self._selected = selected
+        # A plain QWidget subclass only paints its stylesheet background
+        # when asked to
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        # Arrow-key/typing bursts on the spin boxes are applied to the step
+        # once they settle (see flush_changes for readers that can't wait)
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(50)
+        self._change_timer.timeout.connect(self._apply_changes)
         self._build_ui()
 
     def _build_ui(self):
@@ -88,15 +122,10 @@ class StepCard(QWidget):
 
         # Button selection (multi-select via comma-separated IDs shown as names)
         self._combo_button = QComboBox()
-        for b in self._buttons:
-            self._combo_button.addItem(b.name or b.id, b.id)
-        # Pre-select first matching button
-        if self.step.button_ids:
-            idx = next(
-                (i for i, b in enumerate(self._buttons) if b.id in self.step.button_ids),
-                0,
-            )
-            self._combo_button.setCurrentIndex(idx)
+        # One bulk insert; ids are looked up in self.options by row rather
+        # than stored as item data (which would cost a setItemData per button)
+        self._combo_button.addItems([label for label, _ in self.options])
+        self._select_button()
         self._combo_button.currentIndexChanged.connect(self._on_changed)
         layout.addRow(tr("Button:"), self._combo_button)
 
@@ -142,32 +171,59 @@ class StepCard(QWidget):
 
         # Remove button
         btn_remove = QPushButton(tr("Remove"))
-        btn_remove.clicked.connect(lambda: self.removed.emit(self))
+        btn_remove.clicked.connect(self._emit_removed)
         layout.addRow(btn_remove)
 
-    def _update_style(self):
-        bg, border = _CARD_COLORS[self._color_index]
-        if self._selected:
-            self.setStyleSheet(
-                f"StepCard {{ border: 2px solid {border}; border-radius: 6px; "
-                f"background: {bg}; padding: 4px; }}"
-            )
-        else:
-            self.setStyleSheet(
-                f"StepCard {{ border: 1px solid {border}; border-radius: 6px; "
-                f"background: {bg}; padding: 4px; }}"
-            )
+        # Values above are set before connecting, so building the form
+        # dispatches no _on_changed; sync_from_step blocks these instead
+        self._inputs = (
+            self._combo_button, self._spin_repeat, self._spin_intra,
+            self._spin_inter, self._combo_cond, self._spin_timeout,
+        )
 
-    def set_selected(self, on: bool):
-        self._selected = on
-        self._update_style()
+    def _select_button(self):
+        # Pre-select first matching button
+        idx = next(
+            (i for i, (_, bid) in enumerate(self.options) if bid in self.step.button_ids),
+            0,
+        )
+        self._combo_button.setCurrentIndex(idx)
+
+    def _emit_removed(self):
+        self.removed.emit(self)
 
-    def mousePressEvent(self, event):
-        self.selected.emit(self)
-        super().mousePressEvent(event)
+    def _update_style(self):
+        # Rules live in _CARD_QSS on the card area; re-polish to apply them
+        self.setProperty("cardColor", self._color_index)
+        self.setProperty("selected", self._selected)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
 
-    def _on_changed(self):
-        bid = self._combo_button.currentData()
+    def set_selected(self, on: bool):
+        if on != self._selected:
+            self._selected = on
+            self._update_style()
+
+    def set_color_index(self, color_index: int):
+        color_index %= len(_CARD_COLORS)
+        if color_index != self._color_index:
+            self._color_index = color_index
+            self._update_style()
+
+    def _on_changed(self, *_):
+        self._change_timer.start()
+
+    def flush_changes(self):
+        """Apply a pending (debounced) edit to ``self.step`` right away."""
+        if self._change_timer.isActive():
+            self._change_timer.stop()
+            self._apply_changes()
+
+    def _apply_changes(self):
+        row = self._combo_button.currentIndex()
+        bid = self.options[row][1] if row >= 0 else None
         self.step.button_ids = [bid] if bid else []
         self.step.repeat = self._spin_repeat.value()
         self.step.intra_delay = DelayConfig(mode="fixed", fixed_value=self._spin_intra.value())
@@ -177,8 +233,176 @@ class StepCard(QWidget):
         self.changed.emit()
 
     def sync_from_step(self):
-        """Re-populate widgets from self.step."""
+        """Re-populate widgets from self.step (not reported as an edit)."""
+        for w in self._inputs:
+            w.blockSignals(True)
+        self._select_button()
         self._spin_repeat.setValue(self.step.repeat)
+        self._spin_intra.setValue(self.step.intra_delay.fixed_value)
+        self._spin_inter.setValue(self.step.inter_delay.fixed_value)
+        self._combo_cond.setCurrentIndex(max(self._combo_cond.findData(self.step.condition), 0))
+        self._spin_timeout.setValue(self.step.condition_timeout)
+        for w in self._inputs:
+            w.blockSignals(False)
+
+    def rebind(self, step: StepConfig, options: List[Tuple[str, str]], color_index: int):
+        """Point a recycled card at another step (see ``StepCardDelegate``)."""
+        self.flush_changes()
+        self.step = step
+        if options != self.options:
+            self.options = options
+            self._combo_button.blockSignals(True)
+            self._combo_button.clear()
+            self._combo_button.addItems([label for label, _ in options])
+            self._combo_button.blockSignals(False)
+        self.set_color_index(color_index)
+        self.sync_from_step()
+
+
+# ──────────────────────────────────────────────────────────────────
+# Step list model / delegate
+# ──────────────────────────────────────────────────────────────────
+
+class StepListModel(QAbstractListModel):
+    """One row per ``StepConfig``; ``UserRole`` returns the step itself."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._steps: List[StepConfig] = []
+        self._names: Dict[str, str] = {}  # button id → display name
+
+    @property
+    def steps(self) -> List[StepConfig]:
+        return self._steps
+
+    def set_steps(self, steps: List[StepConfig]):
+        self.beginResetModel()
+        self._steps = steps
+        self.endResetModel()
+
+    def set_button_names(self, names: Dict[str, str]):
+        if names != self._names:
+            self._names = names
+            if self._steps:
+                self.dataChanged.emit(self.index(0), self.index(len(self._steps) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._steps)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        step = self._steps[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._summary(index.row(), step)
+        if role == Qt.ItemDataRole.UserRole:
+            return step
+        return None
+
+    def _summary(self, row: int, step: StepConfig) -> str:
+        label = " | ".join(self._names.get(bid, bid) for bid in step.button_ids) or "—"
+        if step.repeat > 1:
+            label += f" ×{step.repeat}"
+        text = (f"{row + 1}. {label}    "
+                f"{step.intra_delay.fixed_value:g}s / {step.inter_delay.fixed_value:g}s")
+        if step.condition != StepCondition.NONE:
+            text += f"    {step.condition.value}"
+        return text
+
+    def row_of(self, step: StepConfig, hint: int = -1) -> int:
+        """Row holding *step* (by identity); *hint* is checked before scanning."""
+        if 0 <= hint < len(self._steps) and self._steps[hint] is step:
+            return hint
+        return next((i for i, s in enumerate(self._steps) if s is step), -1)
+
+    def append_step(self, step: StepConfig):
+        row = len(self._steps)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._steps.append(step)
+        self.endInsertRows()
+
+    def remove_step(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._steps[row]
+        self.endRemoveRows()
+
+    def move_step(self, row: int, delta: int) -> bool:
+        """Move the step at *row* by *delta* (±1) positions."""
+        dst = row + delta
+        if not (0 <= row < len(self._steps) and 0 <= dst < len(self._steps)):
+            return False
+        # beginMoveRows takes the destination *before* the move
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), dst + 1 if delta > 0 else dst)
+        self._steps.insert(dst, self._steps.pop(row))
+        self.endMoveRows()
+        return True
+
+
+class StepCardDelegate(QStyledItemDelegate):
+    """
+    Paints each step as a compact coloured card.  Only the current step
+    gets a real widget: the full ``StepCard`` form, opened by the editor as
+    a persistent editor, so a long sequence costs one form, not one per step.
+    Closed forms are kept and rebound rather than deleted, so moving the
+    selection doesn't rebuild the form each time.
+    """
+
+    _PADDING = 8
+
+    def __init__(self, create_card, view: QListView):
+        super().__init__(view)
+        self._create_card = create_card  # (parent, index, recycled card or None) -> StepCard
+        self._view = view
+        self._card_pool: List[StepCard] = []
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
+        if self._view.indexWidget(index) is not None:
+            return  # covered by the open form
+        bg, border = _CARD_COLORS[index.row() % len(_CARD_COLORS)]
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(border), 2 if selected else 1))
+        painter.setBrush(QColor(bg))
+        painter.drawRoundedRect(option.rect.adjusted(1, 1, -1, -1), 6, 6)
+        painter.setPen(QColor("#202124"))
+        painter.drawText(
+            option.rect.adjusted(self._PADDING, 0, -self._PADDING, 0),
+            Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+            index.data(),
+        )
+        painter.restore()
+
+    def _row_width(self) -> int:
+        # Rows span the viewport (minus list spacing on both sides)
+        return self._view.viewport().width() - 2 * self._view.spacing()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
+        width = self._row_width()
+        editor = self._view.indexWidget(index)
+        if editor is not None:
+            return QSize(width, editor.sizeHint().height())
+        return QSize(width, option.fontMetrics.height() + 2 * self._PADDING)
+
+    def createEditor(self, parent, option, index):
+        card = self._card_pool.pop() if self._card_pool else None
+        return self._create_card(parent, index, card)
+
+    def destroyEditor(self, editor, index):
+        # The view has already hidden it; park it for the next createEditor
+        editor.flush_changes()
+        self._card_pool.append(editor)
+
+    def updateEditorGeometry(self, editor, option, index):
+        rect = option.rect
+        rect.setWidth(self._row_width())
+        editor.setGeometry(rect)
+
+    def setEditorData(self, editor, index):
+        pass  # the card edits its StepConfig directly
+
+    def setModelData(self, editor, model, index):
+        editor.flush_changes()
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -193,15 +417,37 @@ class SlidingStackedWidget(QStackedWidget):
         self._speed = 300
         self._easing = QEasingCurve.Type.OutCubic
         self._animating = False
+        self._animations_enabled = True
         self._next_index = 0
         self._prev_index = 0
+        # One pair of animations, retargeted on every slide
+        self._anim_cur = QPropertyAnimation(self)
+        self._anim_nxt = QPropertyAnimation(self)
+        self._group = QParallelAnimationGroup(self)
+        for anim in (self._anim_cur, self._anim_nxt):
+            anim.setPropertyName(b"pos")
+            anim.setDuration(self._speed)
+            anim.setEasingCurve(self._easing)
+            self._group.addAnimation(anim)
+        self._group.finished.connect(self._on_slide_done)
+
+    def set_animations_enabled(self, on: bool):
+        """With animations off, ``slide_to`` switches pages immediately."""
+        self._animations_enabled = on
 
     def slide_to(self, index: int):
         """Animate a horizontal slide to the page at *index*."""
-        if index == self.currentIndex() or self._animating:
-            return
         if index < 0 or index >= self.count():
             return
+        if self._animating:
+            # Finish the running slide at once rather than dropping this one
+            self._group.stop()
+            self._on_slide_done()
+        if index == self.currentIndex():
+            return
+        if not self._animations_enabled or not self.isVisible():
+            self.setCurrentIndex(index)
+            return
 
         self._animating = True
         cur_idx = self.currentIndex()
@@ -218,27 +464,18 @@ class SlidingStackedWidget(QStackedWidget):
         nxt_widget.raise_()
 
         # Slide current widget out
-        anim_cur = QPropertyAnimation(cur_widget, b"pos", self)
-        anim_cur.setDuration(self._speed)
-        anim_cur.setStartValue(cur_widget.pos())
-        anim_cur.setEndValue(QPoint(-direction * width, 0))
-        anim_cur.setEasingCurve(self._easing)
+        self._anim_cur.setTargetObject(cur_widget)
+        self._anim_cur.setStartValue(cur_widget.pos())
+        self._anim_cur.setEndValue(QPoint(-direction * width, 0))
 
         # Slide next widget in
-        anim_nxt = QPropertyAnimation(nxt_widget, b"pos", self)
-        anim_nxt.setDuration(self._speed)
-        anim_nxt.setStartValue(QPoint(direction * width, 0))
-        anim_nxt.setEndValue(QPoint(0, 0))
-        anim_nxt.setEasingCurve(self._easing)
-
-        group = QParallelAnimationGroup(self)
-        group.addAnimation(anim_cur)
-        group.addAnimation(anim_nxt)
+        self._anim_nxt.setTargetObject(nxt_widget)
+        self._anim_nxt.setStartValue(QPoint(direction * width, 0))
+        self._anim_nxt.setEndValue(QPoint(0, 0))
 
         self._next_index = index
         self._prev_index = cur_idx
-        group.finished.connect(self._on_slide_done)
-        group.start(QParallelAnimationGroup.DeletionPolicy.DeleteWhenStopped)
+        self._group.start()
 
     def _on_slide_done(self):
         self.setCurrentIndex(self._next_index)
@@ -251,16 +488,46 @@ class SlidingStackedWidget(QStackedWidget):
 # Sequence Editor
 # ──────────────────────────────────────────────────────────────────
 
+class _ParseTask(QRunnable):
+    """
+    Parse sequence text on the thread pool, then emit *done(steps, error)*
+    (``error`` is None on success).
+    """
+
+    def __init__(self, text: str, button_map: Dict[str, str], done):
+        super().__init__()
+        self._text = text
+        self._button_map = button_map  # private copy; never touched by the GUI
+        self._done = done
+
+    def run(self):
+        try:
+            steps = parse_sequence_text(self._text, self._button_map)
+        except Exception as exc:
+            self._done.emit(None, exc)
+            return
+        self._done.emit(steps, None)
+
+
 class SequenceEditor(QWidget):
     """Panel for editing the click sequence, with text & visual modes."""
 
+    _text_parsed = pyqtSignal(object, object)  # steps, exception (one is None)
+
     def __init__(self, config_mgr: ConfigManager, parent=None):
         super().__init__(parent)
         self._config = config_mgr
-        self._steps: List[StepConfig] = []
-        self._cards: List[StepCard] = []
-        self._selected_idx: int = -1
+        self._model = StepListModel(self)
+        self._editor_card: Optional[StepCard] = None  # form on the current row
+        # (value shown, its naive local ISO string) of the last loaded
+        # schedule, so an unchanged start time isn't re-formatted on export
+        self._scheduled_src: Optional[Tuple[QDateTime, str]] = None
         self._build_ui()
+        self._text_parsed.connect(self._on_text_parsed)
+
+    @property
+    def _steps(self) -> List[StepConfig]:
+        return self._model.steps
 
     def _build_ui(self):
         root = QVBoxLayout(self)
@@ -270,10 +537,10 @@ class SequenceEditor(QWidget):
         self._btn_visual = QPushButton(tr("Visual Mode"))
         self._btn_visual.setCheckable(True)
         self._btn_visual.setChecked(True)
-        self._btn_visual.clicked.connect(lambda: self._switch_mode(0))
+        self._btn_visual.clicked.connect(self._switch_visual)
         self._btn_text = QPushButton(tr("Text Mode"))
         self._btn_text.setCheckable(True)
-        self._btn_text.clicked.connect(lambda: self._switch_mode(1))
+        self._btn_text.clicked.connect(self._switch_text)
         mode_row.addWidget(self._btn_visual)
         mode_row.addWidget(self._btn_text)
         root.addLayout(mode_row)
@@ -285,16 +552,21 @@ class SequenceEditor(QWidget):
         visual_page = QWidget()
         vl = QVBoxLayout(visual_page)
 
-        # Scrollable card area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_content = QWidget()
-        self._card_container = QVBoxLayout(scroll_content)
-        self._card_container.setSpacing(8)
-        self._card_container.addStretch()  # push cards to the top
-        scroll.setWidget(scroll_content)
-        vl.addWidget(scroll, 1)  # stretch factor = 1 so scroll takes available space
+        # Step list: painted cards, with the full form only on the current row
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setItemDelegate(StepCardDelegate(self._create_card, self._list))
+        self._list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list.setResizeMode(QListView.ResizeMode.Adjust)
+        # Lay rows out in batches from the event loop, so loading a long
+        # sequence doesn't run one sizeHint pass over every row up front
+        self._list.setLayoutMode(QListView.LayoutMode.Batched)
+        self._list.setSpacing(4)
+        self._list.setStyleSheet(_CARD_QSS)
+        self._list.selectionModel().currentChanged.connect(self._on_current_changed)
+        vl.addWidget(self._list, 1)  # stretch factor = 1 so the list takes available space
 
         btn_add_step = QPushButton(tr("+ Add Step"))
         btn_add_step.clicked.connect(self._on_add_step)
@@ -318,9 +590,9 @@ class SequenceEditor(QWidget):
         self._text_edit = QPlainTextEdit()
         self._text_edit.setPlaceholderText("A*3 -> B -> C*2")
         tl.addWidget(self._text_edit)
-        btn_apply_text = QPushButton(tr("Apply"))
-        btn_apply_text.clicked.connect(self._on_apply_text)
-        tl.addWidget(btn_apply_text)
+        self._btn_apply_text = QPushButton(tr("Apply"))
+        self._btn_apply_text.clicked.connect(self._on_apply_text)
+        tl.addWidget(self._btn_apply_text)
         tl.addStretch()
         self._stack.addWidget(text_page)
 
@@ -355,6 +627,12 @@ class SequenceEditor(QWidget):
     # Mode switching
     # ═════════════════════════════════════════════════════════════
 
+    def _switch_visual(self):
+        self._switch_mode(0)
+
+    def _switch_text(self):
+        self._switch_mode(1)
+
     def _switch_mode(self, idx: int):
         self._stack.slide_to(idx)
         self._btn_visual.setChecked(idx == 0)
@@ -365,14 +643,13 @@ class SequenceEditor(QWidget):
 
     def _steps_to_text(self) -> str:
         """Convert current steps back to text representation."""
+        self._flush_cards()
         parts = []
         task = self._config.task
+        # One pass over the buttons instead of a button_by_id scan per id
+        id2name = {b.id: b.name for b in task.buttons} if task else {}
         for s in self._steps:
-            names = []
-            for bid in s.button_ids:
-                b = task.button_by_id(bid) if task else None
-                names.append(b.name if b else bid)
-            label = "|".join(names)
+            label = "|".join(id2name.get(bid, bid) for bid in s.button_ids)
             if s.repeat > 1:
                 label += f"*{s.repeat}"
             parts.append(label)
@@ -386,71 +663,104 @@ class SequenceEditor(QWidget):
         task = self._config.task
         return list(task.buttons) if task else []
 
+    def _button_map(self) -> Dict[str, str]:
+        """
+        Name/id → id lookup for the text parser.  Built per Apply rather
+        than cached: button names are edited in place, so there is no cheap
+        signal that the map went stale, and one pass over the buttons is
+        negligible next to parsing.
+        """
+        button_map: Dict[str, str] = {}
+        for b in self._available_buttons():
+            button_map[b.name] = b.id
+            button_map[b.id] = b.id
+        return button_map
+
+    def _button_options(self) -> List[Tuple[str, str]]:
+        """(label, id) pairs for the step cards' button combos."""
+        return [(b.name or b.id, b.id) for b in self._available_buttons()]
+
     def _on_add_step(self):
         step = StepConfig()
         buttons = self._available_buttons()
         if buttons:
             step.button_ids = [buttons[0].id]
-        self._steps.append(step)
-        self._rebuild_cards()
+        self._refresh_button_names()
+        self._model.append_step(step)
 
     def _on_remove_step(self, card: StepCard):
-        idx = self._cards.index(card)
-        self._steps.pop(idx)
-        self._rebuild_cards()
+        # The form sits on the current row, so this is normally O(1)
+        row = self._model.row_of(card.step, self._list.currentIndex().row())
+        if row >= 0:
+            self._close_editor()
+            self._model.remove_step(row)
 
     def _on_move_up(self):
         """Move the selected step up by one position."""
-        idx = self._selected_idx
-        if idx < 1:
-            return
-        self._steps[idx], self._steps[idx - 1] = self._steps[idx - 1], self._steps[idx]
-        self._selected_idx = idx - 1
-        self._rebuild_cards()
+        self._move_current(-1)
 
     def _on_move_down(self):
         """Move the selected step down by one position."""
-        idx = self._selected_idx
-        if idx < 0 or idx >= len(self._steps) - 1:
-            return
-        self._steps[idx], self._steps[idx + 1] = self._steps[idx + 1], self._steps[idx]
-        self._selected_idx = idx + 1
-        self._rebuild_cards()
-
-    def _on_card_selected(self, card: StepCard):
-        """Track which card the user clicked."""
-        for i, c in enumerate(self._cards):
-            if c is card:
-                self._selected_idx = i
-                c.set_selected(True)
-            else:
-                c.set_selected(False)
-
-    def _rebuild_cards(self):
-        # Clear existing cards
-        for c in self._cards:
-            self._card_container.removeWidget(c)
-            c.deleteLater()
-        self._cards.clear()
+        self._move_current(1)
 
-        # Remove the trailing stretch item before adding new cards
-        stretch_idx = self._card_container.count() - 1
-        if stretch_idx >= 0:
-            item = self._card_container.takeAt(stretch_idx)
-            del item
-
-        buttons = self._available_buttons()
-        for i, step in enumerate(self._steps):
-            card = StepCard(step, buttons, color_index=i)
-            card.removed.connect(self._on_remove_step)
-            card.selected.connect(self._on_card_selected)
-            if i == self._selected_idx:
-                card.set_selected(True)
-            self._card_container.addWidget(card)
-            self._cards.append(card)
-
-        # Re-add stretch at the end to push cards to the top
-        self._card_container.addStretch()
+    def _move_current(self, delta: int):
+        row = self._list.currentIndex().row()
+        if row < 0 or not self._model.move_step(row, delta):
+            return
+        # The persistent editor follows its row; only its colour changes
+        if self._editor_card is not None:
+            self._editor_card.set_color_index(row + delta)
+        self._list.scrollTo(self._model.index(row + delta))
+
+    def _create_card(self, parent: QWidget, index, card: Optional[StepCard]) -> StepCard:
+        step = index.data(Qt.ItemDataRole.UserRole)
+        if card is not None:
+            card.rebind(step, self._button_options(), index.row())
+            return card
+        # The form only ever sits on the current row; selection of the
+        # other rows is painted by the delegate from the view's selection
+        card = StepCard(step, self._button_options(), color_index=index.row(),
+                        selected=True, parent=parent)
+        card.removed.connect(self._on_remove_step)
+        return card
+
+    def _on_current_changed(self, current, previous):
+        """Move the edit form to the newly selected step."""
+        self._close_editor(previous)
+        if current.isValid():
+            self._list.openPersistentEditor(current)
+            self._editor_card = self._list.indexWidget(current)
+            self._list.itemDelegate().sizeHintChanged.emit(current)
+
+    def _close_editor(self, index=None):
+        card = self._editor_card
+        if card is None:
+            return
+        card.flush_changes()
+        self._editor_card = None
+        if index is None or not index.isValid():
+            index = self._model.index(
+                self._model.row_of(card.step, self._list.currentIndex().row()))
+        if index.isValid():
+            self._list.closePersistentEditor(index)
+            self._list.itemDelegate().sizeHintChanged.emit(index)
+
+    def _flush_cards(self):
+        if self._editor_card is not None:
+            self._editor_card.flush_changes()
+
+    def _refresh_button_names(self):
+        self._model.set_button_names({b.id: b.name or b.id for b in self._available_buttons()})
+
+    def _set_steps(self, steps: List[StepConfig]):
+        self._close_editor()
+        self._refresh_button_names()
+        self._model.set_steps(steps)
+
+    def showEvent(self, event):
+        # Buttons may have been renamed on the other tab meanwhile
+        self._refresh_button_names()
+        super().showEvent(event)
 
     # ═════════════════════════════════════════════════════════════
     # Text mode
@@ -459,38 +769,38 @@ class SequenceEditor(QWidget):
     def _on_apply_text(self):
         text = self._text_edit.toPlainText().strip()
         if not text:
-            self._steps.clear()
-            self._rebuild_cards()
+            self._set_steps([])
             QMessageBox.information(self, tr("Success"), tr("Sequence cleared successfully."))
             return
-        try:
-            task = self._config.task
-            button_map = {}
-            if task:
-                for b in task.buttons:
-                    button_map[b.name] = b.id
-                    button_map[b.id] = b.id
-            parsed = parse_sequence_text(text, button_map)
-            if not parsed:
-                raise ValueError("No valid steps could be parsed from the input text.")
-            self._steps = parsed
-            self._rebuild_cards()
-            QMessageBox.information(
-                self, tr("Success"),
-                tr("Sequence applied successfully") + f" \u2014 {len(self._steps)} step(s) loaded.",
-            )
-        except Exception as exc:
+        # Long pastes are parsed off the GUI thread; Apply stays disabled
+        # until the result is in
+        self._btn_apply_text.setEnabled(False)
+        QThreadPool.globalInstance().start(
+            _ParseTask(text, self._button_map(), self._text_parsed))
+
+    def _on_text_parsed(self, parsed: Optional[List[StepConfig]], exc: Optional[Exception]):
+        self._btn_apply_text.setEnabled(True)
+        if exc is None and not parsed:
+            exc = ValueError("No valid steps could be parsed from the input text.")
+        if exc is not None:
             logger.error("Failed to apply text sequence: %s", exc)
             QMessageBox.critical(
                 self, tr("Error"),
                 f"{tr('Error')}: {exc}",
             )
+            return
+        self._set_steps(parsed)
+        QMessageBox.information(
+            self, tr("Success"),
+            tr("Sequence applied successfully") + f" \u2014 {len(self._steps)} step(s) loaded.",
+        )
 
     # ═════════════════════════════════════════════════════════════
     # Public API
     # ═════════════════════════════════════════════════════════════
 
     def get_step_configs(self) -> List[StepConfig]:
+        self._flush_cards()
         return list(self._steps)
 
     def get_loop_settings(self) -> Dict[str, Any]:
@@ -500,15 +810,28 @@ class SequenceEditor(QWidget):
             "scheduled_start": None,
         }
         if self._chk_scheduled.isChecked():
-            settings["scheduled_start"] = self._dt_scheduled.dateTime().toString(Qt.DateFormat.ISODate)
+            qdt = self._dt_scheduled.dateTime()
+            src = self._scheduled_src
+            if src is not None and src[0] == qdt:
+                settings["scheduled_start"] = src[1]
+            else:
+                settings["scheduled_start"] = qdt.toString(Qt.DateFormat.ISODate)
         return settings
 
     def load_from_task(self, task: TaskConfig):
-        self._steps = list(task.steps)
+        self._set_steps(list(task.steps))
         self._spin_loop.setValue(task.loop_count)
         self._spin_interval.setValue(task.round_interval)
         if task.scheduled_start:
             self._chk_scheduled.setChecked(True)
-            from PyQt6.QtCore import QDateTime
-            self._dt_scheduled.setDateTime(QDateTime.fromString(task.scheduled_start, Qt.DateFormat.ISODate))
-        self._rebuild_cards()
+            qdt = QDateTime.fromString(task.scheduled_start, Qt.DateFormat.ISODate)
+            self._dt_scheduled.setDateTime(qdt)
+            shown = self._dt_scheduled.dateTime()
+            # Cache what the edit would export, not the source string: an
+            # offset/"Z" timestamp must still come back naive, since the
+            # scheduler compares it with a naive datetime.now()
+            self._scheduled_src = (
+                (shown, shown.toString(Qt.DateFormat.ISODate)) if qdt.isValid() else None
+            )
+        else:
+            self._scheduled_src = None
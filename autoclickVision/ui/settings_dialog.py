@@ -7,9 +7,9 @@ notifications, screenshot archiving, and failure-rate alerting.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Set, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PyQt6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -23,9 +23,8 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QSpinBox,
+    QTableView,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
@@ -35,9 +34,100 @@ from ..i18n import tr
 logger = logging.getLogger(__name__)
 
 
+class _WebhookModel(QAbstractTableModel):
+    """
+    Editable (name, url) rows backing the webhook table.  Cells are stored
+    stripped, so collecting them needs no per-cell clean-up.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[List[str]] = []
+        self._headers = [tr("Name"), tr("URL")]
+
+    @property
+    def rows(self) -> List[List[str]]:
+        return self._rows
+
+    def set_rows(self, rows: List[List[str]]):
+        self.beginResetModel()
+        self._rows = [[cell.strip() for cell in row] for row in rows]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return (Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsEnabled
+                | Qt.ItemFlag.ItemIsSelectable)
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = str(value).strip()
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._rows[row:row] = [["", ""] for _ in range(count)]
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+
 class SettingsDialog(QDialog):
     """Modal dialog for application-wide settings."""
 
+    # Widget ↔ settings-key bindings, one tuple per tab in tab order:
+    # (key, widget attribute, kind, default).  ``kind`` selects the accessor
+    # pair: "checked" → setChecked/isChecked, "value" → setValue/value,
+    # "webhooks" → the webhook model's rows.
+    _BINDINGS: Tuple[Tuple[Tuple[str, str, str, Any], ...], ...] = (
+        (  # Matcher
+            ("grayscale", "_chk_grayscale", "checked", False),
+            ("multi_scale", "_chk_multi_scale", "checked", False),
+            ("scale_min", "_spin_scale_min", "value", 0.7),
+            ("scale_max", "_spin_scale_max", "value", 1.3),
+            ("scale_step", "_spin_scale_step", "value", 0.05),
+        ),
+        (  # Click
+            ("use_bezier", "_chk_bezier", "checked", False),
+            ("use_directinput", "_chk_directinput", "checked", False),
+            ("global_hotkeys", "_chk_global_hotkeys", "checked", True),
+        ),
+        (  # Notifications
+            ("failure_rate_threshold", "_spin_fr_threshold", "value", 0.5),
+            ("failure_rate_window", "_spin_fr_window", "value", 20),
+            ("webhooks", "_webhook_model", "webhooks", ()),
+        ),
+        (  # Screenshots
+            ("archive_screenshots", "_chk_archive", "checked", True),
+        ),
+        (  # Stop Conditions
+            ("stop_after_consecutive_failures", "_spin_stop_failures", "value", 0),
+            ("stop_after_duration_minutes", "_spin_stop_duration", "value", 0),
+        ),
+    )
+
     def __init__(self, current: Dict[str, Any], parent=None):
         """
         Args:
@@ -50,6 +140,7 @@ class SettingsDialog(QDialog):
                 scale_step      (float)
                 use_bezier      (bool)
                 use_directinput (bool)
+                global_hotkeys  (bool)
                 archive_screenshots (bool)
                 failure_rate_threshold (float)
                 failure_rate_window    (int)
@@ -62,7 +153,8 @@ class SettingsDialog(QDialog):
         self.setMinimumWidth(520)
         self._current = current
         self._build_ui()
-        self._load(current)
+        # The first tab is the one shown on open; the rest wait for a click
+        self._ensure_tab_built(self._tabs.currentIndex())
 
     # ═════════════════════════════════════════════════════════════
     # Build UI
@@ -70,11 +162,47 @@ class SettingsDialog(QDialog):
 
     def _build_ui(self):
         root = QVBoxLayout(self)
-        tabs = QTabWidget()
+        self._tabs = QTabWidget()
+
+        # Tabs start as empty pages and are filled in on first activation;
+        # each entry is (label, build(page)), matching _BINDINGS by index
+        self._tab_specs: List[Tuple[str, Callable[[QWidget], None]]] = [
+            (tr("Matcher"), self._build_matcher_tab),
+            (tr("Click"), self._build_click_tab),
+            (tr("Notifications"), self._build_notifications_tab),
+            (tr("Screenshots"), self._build_screenshots_tab),
+            (tr("Stop Conditions"), self._build_stop_tab),
+        ]
+        self._tabs_built: Set[int] = set()
+        for label, _ in self._tab_specs:
+            self._tabs.addTab(QWidget(), label)
+        self._tabs.currentChanged.connect(self._ensure_tab_built)
+
+        root.addWidget(self._tabs)
+
+        # ── Dialog buttons ──────────────────────────────────────
+        bbox = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        bbox.accepted.connect(self.accept)
+        bbox.rejected.connect(self.reject)
+        root.addWidget(bbox)
 
-        # ── Matcher tab ─────────────────────────────────────────
-        matcher_page = QWidget()
-        ml = QFormLayout(matcher_page)
+    def _ensure_tab_built(self, index: int):
+        """Build (and load) the tab at *index* unless that already happened."""
+        if index < 0 or index in self._tabs_built:
+            return
+        self._tabs_built.add(index)
+        _, build = self._tab_specs[index]
+        page = self._tabs.widget(index)
+        # The page may already be on screen (built from currentChanged):
+        # hold off repaints until it is filled.  Layout requests from the
+        # addRow calls are posted events and coalesce on their own.
+        page.setUpdatesEnabled(False)
+        build(page)
+        self._load_tab(index, self._current)
+        page.setUpdatesEnabled(True)
+
+    def _build_matcher_tab(self, page: QWidget):
+        ml = QFormLayout(page)
 
         self._chk_grayscale = QCheckBox(tr("Grayscale matching"))
         ml.addRow(self._chk_grayscale)
@@ -97,11 +225,8 @@ class SettingsDialog(QDialog):
         self._spin_scale_step.setSingleStep(0.01)
         ml.addRow(tr("Scale step:"), self._spin_scale_step)
 
-        tabs.addTab(matcher_page, tr("Matcher"))
-
-        # ── Click tab ───────────────────────────────────────────
-        click_page = QWidget()
-        cl = QFormLayout(click_page)
+    def _build_click_tab(self, page: QWidget):
+        cl = QFormLayout(page)
 
         self._chk_bezier = QCheckBox(tr("B\u00e9zier curve mouse movement"))
         cl.addRow(self._chk_bezier)
@@ -109,11 +234,11 @@ class SettingsDialog(QDialog):
         self._chk_directinput = QCheckBox(tr("PyDirectInput mode (fullscreen games)"))
         cl.addRow(self._chk_directinput)
 
-        tabs.addTab(click_page, tr("Click"))
+        self._chk_global_hotkeys = QCheckBox(tr("Global hotkeys (F9/F10/F11 work while unfocused)"))
+        cl.addRow(self._chk_global_hotkeys)
 
-        # ── Notifications tab ───────────────────────────────────
-        notify_page = QWidget()
-        nl = QVBoxLayout(notify_page)
+    def _build_notifications_tab(self, page: QWidget):
+        nl = QVBoxLayout(page)
 
         # Failure rate
         fr_group = QGroupBox(tr("Failure-Rate Alert"))
@@ -132,11 +257,14 @@ class SettingsDialog(QDialog):
         # Webhook table
         wh_group = QGroupBox(tr("Webhooks (Telegram / DingTalk / Slack)"))
         whl = QVBoxLayout()
-        self._webhook_table = QTableWidget(0, 2)
-        self._webhook_table.setHorizontalHeaderLabels([tr("Name"), tr("URL")])
+        self._webhook_model = _WebhookModel(self)
+        self._webhook_table = QTableView()
+        self._webhook_table.setModel(self._webhook_model)
         self._webhook_table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch,
         )
+        # Row numbers mean nothing here; skip laying out and painting them
+        self._webhook_table.verticalHeader().setVisible(False)
         whl.addWidget(self._webhook_table)
 
         btn_row = QHBoxLayout()
@@ -152,20 +280,14 @@ class SettingsDialog(QDialog):
         nl.addWidget(wh_group)
         nl.addStretch()
 
-        tabs.addTab(notify_page, tr("Notifications"))
-
-        # ── Screenshot tab ──────────────────────────────────────
-        ss_page = QWidget()
-        sl = QFormLayout(ss_page)
+    def _build_screenshots_tab(self, page: QWidget):
+        sl = QFormLayout(page)
 
         self._chk_archive = QCheckBox(tr("Archive failure screenshots to logs/screenshots/"))
         sl.addRow(self._chk_archive)
 
-        tabs.addTab(ss_page, tr("Screenshots"))
-
-        # ── Stop Conditions tab ─────────────────────────────────
-        stop_page = QWidget()
-        stl = QFormLayout(stop_page)
+    def _build_stop_tab(self, page: QWidget):
+        stl = QFormLayout(page)
 
         self._spin_stop_failures = QSpinBox()
         self._spin_stop_failures.setRange(0, 9999)
@@ -178,78 +300,69 @@ class SettingsDialog(QDialog):
         self._spin_stop_duration.setSpecialValueText(tr("Disabled"))
         stl.addRow(tr("Stop after duration:"), self._spin_stop_duration)
 
-        tabs.addTab(stop_page, tr("Stop Conditions"))
-
-        root.addWidget(tabs)
-
-        # ── Dialog buttons ──────────────────────────────────────
-        bbox = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        bbox.accepted.connect(self.accept)
-        bbox.rejected.connect(self.reject)
-        root.addWidget(bbox)
-
     # ═════════════════════════════════════════════════════════════
     # Webhook helpers
     # ═════════════════════════════════════════════════════════════
 
     def _on_add_webhook(self):
-        row = self._webhook_table.rowCount()
-        self._webhook_table.insertRow(row)
-        self._webhook_table.setItem(row, 0, QTableWidgetItem(""))
-        self._webhook_table.setItem(row, 1, QTableWidgetItem(""))
+        self._webhook_model.insertRows(self._webhook_model.rowCount(), 1)
 
     def _on_remove_webhook(self):
-        row = self._webhook_table.currentRow()
+        row = self._webhook_table.currentIndex().row()
         if row >= 0:
-            self._webhook_table.removeRow(row)
+            self._webhook_model.removeRows(row, 1)
 
     # ═════════════════════════════════════════════════════════════
     # Load / collect
     # ═════════════════════════════════════════════════════════════
 
+    def load_settings(self, current: Dict[str, Any]):
+        """Reset every field to *current*, e.g. before showing the dialog again."""
+        self._load(current)
+
     def _load(self, s: Dict[str, Any]):
-        self._chk_grayscale.setChecked(s.get("grayscale", False))
-        self._chk_multi_scale.setChecked(s.get("multi_scale", False))
-        self._spin_scale_min.setValue(s.get("scale_min", 0.7))
-        self._spin_scale_max.setValue(s.get("scale_max", 1.3))
-        self._spin_scale_step.setValue(s.get("scale_step", 0.05))
-        self._chk_bezier.setChecked(s.get("use_bezier", False))
-        self._chk_directinput.setChecked(s.get("use_directinput", False))
-        self._chk_archive.setChecked(s.get("archive_screenshots", True))
-        self._spin_fr_threshold.setValue(s.get("failure_rate_threshold", 0.5))
-        self._spin_fr_window.setValue(s.get("failure_rate_window", 20))
-        self._spin_stop_failures.setValue(s.get("stop_after_consecutive_failures", 0))
-        self._spin_stop_duration.setValue(s.get("stop_after_duration_minutes", 0))
-
-        for wh in s.get("webhooks", []):
-            row = self._webhook_table.rowCount()
-            self._webhook_table.insertRow(row)
-            self._webhook_table.setItem(row, 0, QTableWidgetItem(wh.get("name", "")))
-            self._webhook_table.setItem(row, 1, QTableWidgetItem(wh.get("url", "")))
+        """
+        Remember *s* for tabs not built yet and load it into the rest.
+
+        Nothing is connected to the value widgets' change signals (settings
+        are only read back in ``get_settings``), so the loaders set values
+        directly; wrap them in blockSignals if a live handler is ever added.
+        """
+        self._current = s
+        for index in sorted(self._tabs_built):
+            self._load_tab(index, s)
+
+    def _load_tab(self, index: int, s: Dict[str, Any]):
+        for key, attr, kind, default in self._BINDINGS[index]:
+            widget = getattr(self, attr)
+            value = s.get(key, default)
+            if kind == "checked":
+                widget.setChecked(value)
+            elif kind == "value":
+                widget.setValue(value)
+            else:
+                # Runs when the tab is first built and on each later
+                # load_settings; the model holds plain strings, so either
+                # way this is one reset rather than per-cell items
+                widget.set_rows([[wh.get("name", ""), wh.get("url", "")] for wh in value])
 
     def get_settings(self) -> Dict[str, Any]:
         """Collect all settings from the dialog widgets."""
-        webhooks: List[Dict[str, str]] = []
-        for r in range(self._webhook_table.rowCount()):
-            name_item = self._webhook_table.item(r, 0)
-            url_item = self._webhook_table.item(r, 1)
-            name = name_item.text().strip() if name_item else ""
-            url = url_item.text().strip() if url_item else ""
-            if name and url:
-                webhooks.append({"name": name, "url": url})
-
-        return {
-            "grayscale": self._chk_grayscale.isChecked(),
-            "multi_scale": self._chk_multi_scale.isChecked(),
-            "scale_min": self._spin_scale_min.value(),
-            "scale_max": self._spin_scale_max.value(),
-            "scale_step": self._spin_scale_step.value(),
-            "use_bezier": self._chk_bezier.isChecked(),
-            "use_directinput": self._chk_directinput.isChecked(),
-            "archive_screenshots": self._chk_archive.isChecked(),
-            "failure_rate_threshold": self._spin_fr_threshold.value(),
-            "failure_rate_window": self._spin_fr_window.value(),
-            "webhooks": webhooks,
-            "stop_after_consecutive_failures": self._spin_stop_failures.value(),
-            "stop_after_duration_minutes": self._spin_stop_duration.value(),
-        }
+        # Tabs never opened still hold their loaded values once built
+        for index in range(len(self._tab_specs)):
+            self._ensure_tab_built(index)
+
+        settings: Dict[str, Any] = {}
+        for bindings in self._BINDINGS:
+            for key, attr, kind, _ in bindings:
+                widget = getattr(self, attr)
+                if kind == "checked":
+                    settings[key] = widget.isChecked()
+                elif kind == "value":
+                    settings[key] = widget.value()
+                else:
+                    # Rows missing a name or URL are dropped
+                    settings[key] = [
+                        {"name": name, "url": url} for name, url in widget.rows if name and url
+                    ]
+        return settings
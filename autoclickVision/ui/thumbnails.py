@@ -0,0 +1,211 @@
+"""
+Thumbnail Helpers
+Shrink-on-load image decoding shared by the button editor preview and the
+log viewer's screenshot list, backed by Qt's global ``QPixmapCache``.
+``LazyThumbnailDelegate`` defers decoding to paint time on a worker thread.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Optional, Set
+
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QImageReader, QPixmap, QPixmapCache
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+# QPixmapCache budget in KiB (Qt's default is 10 MiB)
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+
+
+def scale_transform(src: QSize, target: QSize) -> Qt.TransformationMode:
+    """
+    Filter for scaling *src* down to *target*: smooth filtering only pays
+    off for large reductions, so within 2× a nearest-neighbour scale is used.
+    """
+    ratio = max(
+        src.width() / max(target.width(), 1),
+        src.height() / max(target.height(), 1),
+    )
+    if ratio <= 2.0:
+        return Qt.TransformationMode.FastTransformation
+    return Qt.TransformationMode.SmoothTransformation
+
+
+def load_scaled_image(path: str, size: QSize) -> QImage:
+    """
+    Decode the image at *path* scaled to fit *size*, keeping the aspect
+    ratio.  Images smaller than *size* are scaled up, like a
+    ``KeepAspectRatio`` scale of the full image would be.
+
+    ``QImageReader.setScaledSize`` lets decoders that support it (JPEG)
+    emit only the target-sized pixels instead of decoding the full image
+    and scaling afterwards.  Returns a null ``QImage`` on failure.  Safe to
+    call off the GUI thread.
+    """
+    reader = QImageReader(path)
+    # Honour EXIF orientation, matching what a full QImage(path) load shows
+    reader.setAutoTransform(True)
+    src = reader.size()
+    if not src.isValid():
+        # Format can't report its size up front — decode fully, then scale.
+        img = QImage(path)
+        if img.isNull():
+            return img
+        return img.scaled(
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            scale_transform(img.size(), size),
+        )
+    reader.setScaledSize(src.scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+def load_scaled_pixmap(path: str, size: QSize) -> QPixmap:
+    """GUI-thread wrapper around ``load_scaled_image``."""
+    return QPixmap.fromImage(load_scaled_image(path, size))
+
+
+def _cache_key(path: str, size: QSize) -> Optional[str]:
+    """``QPixmapCache`` key for *path* at *size*, or None if the file is gone."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return f"{path}:{mtime}:{size.width()}x{size.height()}"
+
+
+def cached_scaled_pixmap(path: str, size: QSize, dpr: float = 1.0) -> QPixmap:
+    """
+    ``load_scaled_pixmap`` memoised in ``QPixmapCache``.
+
+    The key includes the file's mtime, so re-saving an image invalidates
+    its thumbnails automatically.  *dpr* is the target widget's device
+    pixel ratio: the image is decoded at device resolution and tagged so
+    the paint engine draws it 1:1 instead of rescaling on HiDPI screens.
+    """
+    device_size = size * dpr if dpr != 1.0 else size
+    key = _cache_key(path, device_size)
+    if key is None:
+        return QPixmap()
+    pm = QPixmapCache.find(key)
+    if pm is None:
+        pm = load_scaled_pixmap(path, device_size)
+        if pm.isNull():
+            return pm
+        # Tag before caching so hits come back ready to draw; setting it on
+        # a cached copy would detach (deep-copy) the pixmap on every hit
+        pm.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(key, pm)
+    elif pm.devicePixelRatio() != dpr:
+        # Same device size cached for another ratio (e.g. 64 px @2x vs 128 px @1x)
+        pm.setDevicePixelRatio(dpr)
+    return pm
+
+
+# ═════════════════════════════════════════════════════════════════
+# Lazy thumbnails for item views
+# ═════════════════════════════════════════════════════════════════
+
+class _DecodeSignals(QObject):
+    done = pyqtSignal(str, str, QImage)  # cache key, path, image
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, key: str, path: str, size: QSize, signals: _DecodeSignals):
+        super().__init__()
+        self._key = key
+        self._path = path
+        self._size = size
+        self._signals = signals
+
+    def run(self):
+        image = load_scaled_image(self._path, self._size)
+        try:
+            self._signals.done.emit(self._key, self._path, image)
+        except RuntimeError:
+            pass  # delegate destroyed while decoding (view closed)
+
+
+class LazyThumbnailDelegate(QStyledItemDelegate):
+    """
+    Item delegate that draws a thumbnail of the file stored in
+    ``Qt.ItemDataRole.UserRole``.
+
+    Nothing is decoded until a row is actually painted; the decode then
+    runs on the global ``QThreadPool`` and the row repaints from
+    ``QPixmapCache`` once it lands.  Rows that are never scrolled into
+    view cost no I/O.
+    """
+
+    # Roughly a couple of screens' worth of rows; older icons fall back to
+    # QPixmapCache (or a fresh decode) when scrolled back into view
+    MAX_ICONS = 64
+
+    def __init__(self, size: QSize, parent=None):
+        super().__init__(parent)
+        self._size = QSize(size)
+        self._in_flight: Set[str] = set()
+        # Keys that failed to decode (corrupt/unreadable file); not retried.
+        # Keys carry the mtime, so a file caught mid-write or later
+        # overwritten gets a new key and is decoded again.  Bounded like
+        # _icons, oldest first.
+        self._failed: "OrderedDict[str, None]" = OrderedDict()
+        # Small LRU of ready-made icons so painting doesn't build a QIcon
+        # per row per frame
+        self._icons: "OrderedDict[str, QIcon]" = OrderedDict()
+        blank = QPixmap(self._size)
+        blank.fill(Qt.GlobalColor.transparent)
+        self._placeholder = QIcon(blank)
+        self._signals = _DecodeSignals(self)
+        # Queued: the signal is emitted from a pool thread
+        self._signals.done.connect(self._on_decoded, Qt.ConnectionType.QueuedConnection)
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index):
+        super().initStyleOption(option, index)
+        path = index.data(Qt.ItemDataRole.UserRole)
+        if not path:
+            return
+        # Stat on every paint: the mtime in the key is what picks up a
+        # rewritten file
+        key = _cache_key(path, self._size)
+        if key is None:
+            return
+        icon = self._icons.get(key)
+        if icon is None:
+            pm = QPixmapCache.find(key)
+            if pm is None:
+                if key not in self._in_flight and key not in self._failed:
+                    self._in_flight.add(key)
+                    QThreadPool.globalInstance().start(
+                        _DecodeTask(key, path, self._size, self._signals))
+                # Reserve the icon slot so the row doesn't reflow when it lands
+                icon = self._placeholder
+            else:
+                icon = self._remember(key, QIcon(pm))
+        else:
+            self._icons.move_to_end(key)
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+        option.icon = icon
+
+    def _remember(self, key: str, icon: QIcon) -> QIcon:
+        self._icons[key] = icon
+        if len(self._icons) > self.MAX_ICONS:
+            self._icons.popitem(last=False)
+        return icon
+
+    def _on_decoded(self, key: str, path: str, image: QImage):
+        self._in_flight.discard(key)
+        if image.isNull():
+            # Keep the placeholder; don't decode this version again
+            self._failed[key] = None
+            if len(self._failed) > self.MAX_ICONS:
+                self._failed.popitem(last=False)
+            return
+        pm = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pm)
+        self._remember(key, QIcon(pm))
+        view = self.parent()
+        if view is not None and hasattr(view, "viewport"):
+            view.viewport().update()